@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,11 +14,21 @@ class Settings(BaseSettings):
     # Example: "https://myapp.com,https://api.myapp.com"
     CORS_ORIGINS: str = "*"
 
-    @property
+    # Seconds browsers may cache a preflight response (24 h).
+    CORS_MAX_AGE: int = 86400
+
+    # Parsed once per instance — CORS_ORIGINS never changes after startup.
+    @cached_property
     def cors_origins_list(self) -> list[str]:
         if self.CORS_ORIGINS.strip() == "*":
             return ["*"]
         return [o.strip() for o in self.CORS_ORIGINS.split(",") if o.strip()]
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings singleton (.env is read once). Usable as a FastAPI dependency."""
+    return Settings()
+
+
+settings = get_settings()
@@ -0,0 +1,120 @@
+"""
+Pure-ASGI CORS middleware.
+
+Replaces Starlette's CORSMiddleware on the hot path. Everything that can be
+known at startup (allowed origins, preflight headers) is encoded to bytes
+once in __init__; per request the middleware only reads the Origin header
+and, for simple requests, appends the allow-origin header to the response.
+
+Requests without an Origin header (same-origin, curl, health probes) are
+passed through untouched.
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+
+class FastCORSMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        self._allow_all_origins = "*" in allow_origins
+        self._allow_origins = frozenset(o.encode("latin-1") for o in allow_origins)
+        self._allow_all_headers = "*" in allow_headers
+        self._allow_credentials = allow_credentials
+        # With credentials the spec forbids a literal "*", so the request
+        # Origin has to be echoed back (and the response varies on it).
+        self._echo_origin = not self._allow_all_origins or allow_credentials
+
+        methods = _ALL_METHODS if "*" in allow_methods else allow_methods
+        preflight: list[tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", ", ".join(methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+        if not self._allow_all_headers and allow_headers:
+            preflight.append(
+                (b"access-control-allow-headers", ", ".join(allow_headers).encode("latin-1"))
+            )
+        simple: list[tuple[bytes, bytes]] = []
+        if allow_credentials:
+            simple.append((b"access-control-allow-credentials", b"true"))
+        if self._echo_origin:
+            simple.append((b"vary", b"Origin"))
+        self._simple_headers = simple
+        self._preflight_headers = preflight + simple
+
+    def _origin_header(self, origin: bytes) -> tuple[bytes, bytes]:
+        if self._echo_origin:
+            return (b"access-control-allow-origin", origin)
+        return (b"access-control-allow-origin", b"*")
+
+    def _is_allowed(self, origin: bytes) -> bool:
+        return self._allow_all_origins or origin in self._allow_origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_headers, send)
+            return
+
+        if not self._is_allowed(origin):
+            await self.app(scope, receive, send)
+            return
+
+        extra = [self._origin_header(origin), *self._simple_headers]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, origin: bytes, request_headers: bytes | None, send: Send) -> None:
+        if not self._is_allowed(origin):
+            body = b"Disallowed CORS origin"
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = [self._origin_header(origin), *self._preflight_headers]
+        if self._allow_all_headers and request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
@@ -9,9 +9,10 @@ from __future__ import annotations
 from datetime import date
 from typing import Any
 
+import orjson
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from starlette import status
 
 
@@ -35,12 +36,18 @@ class DIOSException(Exception):
             payload["details"] = self.details
         return payload
 
+    @classmethod
+    def cached_bytes(cls) -> bytes | None:
+        """Pre-serialized body for errors whose payload never varies; else None."""
+        return _FIXED_ERROR_BYTES.get(cls)
+
 
 class DayAlreadyClosedError(DIOSException):
     http_status = status.HTTP_409_CONFLICT
     code = "DAY_ALREADY_CLOSED"
 
     def __init__(self, day: date):
+        self.day = day
         super().__init__(
             message=f"Day {day} is already closed.",
             details={"day": str(day)},
@@ -52,6 +59,8 @@ class BatchTooLargeError(DIOSException):
     code = "BATCH_TOO_LARGE"
 
     def __init__(self, max_items: int, received: int):
+        self.max_items = max_items
+        self.received = received
         super().__init__(
             message=f"Batch exceeds maximum size of {max_items} items. Received {received}.",
             details={"max_items": max_items, "received": received},
@@ -77,6 +86,14 @@ class EntryIngestionError(DIOSException):
         )
 
 
+class InvalidCursorError(DIOSException):
+    http_status = status.HTTP_400_BAD_REQUEST
+    code = "INVALID_CURSOR"
+
+    def __init__(self):
+        super().__init__(message="Pagination cursor is malformed.")
+
+
 class RouterNoActiveRulesError(DIOSException):
     http_status = status.HTTP_500_INTERNAL_SERVER_ERROR
     code = "ROUTER_NO_ACTIVE_RULES"
@@ -87,12 +104,31 @@ class RouterNoActiveRulesError(DIOSException):
         )
 
 
+# ---------------------------------------------------------------------------
+# Pre-serialized payloads
+# ---------------------------------------------------------------------------
+
+_INTERNAL_ERROR_BYTES = orjson.dumps({
+    "code": "INTERNAL_ERROR",
+    "message": "An unexpected error occurred.",
+})
+
+# Errors that take no arguments serialize to the same body every time.
+_FIXED_ERROR_BYTES: dict[type[DIOSException], bytes] = {
+    cls: orjson.dumps(cls().to_dict())
+    for cls in (EmptyBatchError, InvalidCursorError, RouterNoActiveRulesError)
+}
+
+
 # ---------------------------------------------------------------------------
 # FastAPI exception handlers
 # ---------------------------------------------------------------------------
 
-async def dios_exception_handler(request: Request, exc: DIOSException) -> JSONResponse:
-    return JSONResponse(
+async def dios_exception_handler(request: Request, exc: DIOSException) -> Response:
+    body = exc.cached_bytes()
+    if body is not None:
+        return Response(content=body, status_code=exc.http_status, media_type="application/json")
+    return ORJSONResponse(
         status_code=exc.http_status,
         content=exc.to_dict(),
     )
@@ -100,16 +136,21 @@ async def dios_exception_handler(request: Request, exc: DIOSException) -> JSONRe
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Return structured 422 with machine-readable field errors."""
-    field_errors = []
-    for error in exc.errors():
-        field_errors.append({
-            "field": ".".join(str(loc) for loc in error["loc"] if loc != "body"),
+    # loc entries are mostly str; only list indices need str() conversion.
+    field_errors = [
+        {
+            "field": ".".join(
+                loc if loc.__class__ is str else str(loc)
+                for loc in error["loc"] if loc != "body"
+            ),
             "message": error["msg"],
             "type": error["type"],
-        })
-    return JSONResponse(
+        }
+        for error in exc.errors()
+    ]
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "code": "VALIDATION_ERROR",
@@ -119,11 +160,22 @@ async def validation_exception_handler(
     )
 
 
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    return JSONResponse(
+async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
+    return Response(
+        content=_INTERNAL_ERROR_BYTES,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "code": "INTERNAL_ERROR",
-            "message": "An unexpected error occurred.",
-        },
+        media_type="application/json",
     )
+
+
+# Handler table for FastAPI(exception_handlers=...). Starlette already
+# resolves a raised exception by walking type(exc).__mro__ against this dict,
+# so dispatch is a handful of dict lookups. Keep the three entries separate:
+# an `Exception` handler runs in ServerErrorMiddleware, which re-raises after
+# responding, and FastAPI's built-in RequestValidationError handler would
+# shadow a single catch-all.
+EXCEPTION_HANDLERS: dict[type[Exception], Any] = {
+    DIOSException: dios_exception_handler,
+    RequestValidationError: validation_exception_handler,
+    Exception: unhandled_exception_handler,
+}
@@ -0,0 +1,17 @@
+"""
+Gunicorn worker class for production (see gunicorn.conf.py).
+
+Kept importable by dotted path because Gunicorn resolves worker_class
+from a string.
+"""
+from uvicorn.workers import UvicornWorker
+
+
+class DiosUvicornWorker(UvicornWorker):
+    """
+    UvicornWorker pinned to uvloop + httptools (both ship with
+    uvicorn[standard]). The stock "auto" setting silently falls back to
+    asyncio + h11 if either is missing from the image; pinning makes that a
+    boot failure instead of a quiet throughput drop.
+    """
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "loop": "uvloop", "http": "httptools"}
@@ -1,10 +1,57 @@
-from sqlalchemy import create_engine
+import enum
+
+from sqlalchemy import JSON, Engine, create_engine, make_url
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-from app.core.config import settings
+from app.core.config import get_settings
+
+
+def _engine_options(url: str) -> dict:
+    """
+    create_engine() keyword arguments for `url`.
+
+    Pooled connections are pinged on checkout and recycled after 30 min,
+    so ones a managed Postgres dropped while idle are replaced instead of
+    failing the next request. The compiled-statement cache is sized above
+    the default 500 so the mix of ORM query shapes across endpoints stays
+    resident. On psycopg2, executemany() that can't use INSERT..RETURNING
+    batching (UPDATEs, plain INSERT executemany) is sent as execute_batch
+    pages instead of one round trip per row.
+    """
+    parsed = make_url(url)
+    options: dict = {
+        "pool_pre_ping": True,
+        "query_cache_size": 1200,
+        "insertmanyvalues_page_size": 1000,
+    }
+    if parsed.get_backend_name() != "sqlite":
+        options["pool_recycle"] = 1800
+    if parsed.get_driver_name() == "psycopg2":
+        options["executemany_mode"] = "values_plus_batch"
+    return options
+
+
+_url = get_settings().DATABASE_URL
+engine = create_engine(_url, **_engine_options(_url))
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Native JSONB on Postgres (the driver hands back decoded dicts/lists);
+# SQLAlchemy's JSON emulation on SQLite for tests.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+def enum_values(enum_cls: type[enum.Enum]) -> list[str]:
+    """
+    Raw values for a string-valued sqlalchemy.Enum column.
+
+    Same DB type as Enum(enum_cls) (labels == values here), but rows load
+    as plain str and writes skip the Python Enum round trip. The Python
+    enums stay as application-level constants.
+    """
+    return [e.value for e in enum_cls]
 
 
 class Base(DeclarativeBase):
@@ -17,3 +64,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_engine() -> Engine:
+    """Bare pooled engine, for probes that don't need a Session."""
+    return engine
@@ -0,0 +1,41 @@
+"""
+Single-statement upsert: INSERT ... ON CONFLICT DO UPDATE ... RETURNING.
+
+PostgreSQL (production) and SQLite (tests) share the same ON CONFLICT
+syntax; SQLAlchemy exposes it through each dialect's own insert().
+"""
+from __future__ import annotations
+
+from typing import Any, Sequence, TypeVar
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+def upsert(
+    db: Session,
+    model: type[ModelT],
+    values: dict[str, Any],
+    conflict_columns: Sequence[str],
+) -> ModelT:
+    """
+    Insert `values` into `model`'s table, or update the row that collides on
+    `conflict_columns` (which must be covered by a unique constraint).
+
+    One round trip, atomic with respect to concurrent writers. Returns the
+    ORM object for the row; if it is already in the session its attributes
+    are overwritten with the stored values. Does not commit.
+    """
+    stmt = _INSERTS[db.get_bind().dialect.name](model).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_={k: stmt.excluded[k] for k in values if k not in conflict_columns},
+    ).returning(model)
+    return db.scalars(stmt, execution_options={"populate_existing": True}).one()
@@ -1,23 +1,18 @@
 from fastapi import FastAPI, Depends
-from fastapi.exceptions import RequestValidationError
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Engine, text
 
-from app.db.base import get_db
-from app.core.config import settings
+from app.db.base import get_engine
+from app.core.config import get_settings
+from app.core.cors import FastCORSMiddleware
 from app.routers import ingest as ingest_router
 from app.routers import state as state_router
 from app.routers import memory as memory_router
 from app.routers import metrics as metrics_router
 from app.routers import behavior as behavior_router
-from app.core.errors import (
-    DIOSException,
-    dios_exception_handler,
-    validation_exception_handler,
-    unhandled_exception_handler,
-)
+from app.core.errors import EXCEPTION_HANDLERS
+
+settings = get_settings()
 
 app = FastAPI(
     title="DIOS App API",
@@ -28,24 +23,27 @@ app = FastAPI(
         "All error responses follow the `{code, message, details}` envelope."
     ),
     version="2.0.0",
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
+    # Registered up-front so the middleware stack is built once with the
+    # final handler table.
+    exception_handlers=EXCEPTION_HANDLERS,
 )
 
 # --- CORS ---
+# Browsers reject credentialed requests against a literal "*" origin, so
+# credentials are only offered with a concrete origin list. With "*" the
+# middleware sends a constant allow-origin header and never echoes Origin.
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
+    allow_credentials=settings.cors_origins_list != ["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=settings.CORS_MAX_AGE,
 )
 
-# --- Exception handlers (most specific first) ---
-app.add_exception_handler(DIOSException, dios_exception_handler)
-app.add_exception_handler(RequestValidationError, validation_exception_handler)
-app.add_exception_handler(Exception, unhandled_exception_handler)
-
 # --- Routers ---
 app.include_router(ingest_router.router)
 app.include_router(state_router.router)
@@ -54,21 +52,42 @@ app.include_router(metrics_router.router)
 app.include_router(behavior_router.router)
 
 
+
+def _openapi() -> dict:
+    """
+    FastAPI's generated schema plus components for bodies that routes parse
+    themselves (POST /ingest/batch), so their $refs always resolve.
+    """
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        for name, component in ingest_router.OPENAPI_COMPONENTS.items():
+            components.setdefault(name, component)
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+# Parsed once; the probe runs every few seconds.
+_SELECT_1 = text("SELECT 1")
+
+
 @app.get("/health", tags=["health"], summary="Health check")
-def health(db: Session = Depends(get_db)):
+def health(engine: Engine = Depends(get_engine)):
     """
     Returns `{"status": "ok", "db": "ok"}` when both the API and the database
     are reachable. Returns HTTP 503 if the DB is down.
     Used by Railway / Render for liveness probes.
     """
     try:
-        db.execute(text("SELECT 1"))
+        with engine.connect() as conn:
+            conn.execute(_SELECT_1)
         db_status = "ok"
     except Exception:
         db_status = "unreachable"
 
     if db_status != "ok":
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={"status": "error", "db": db_status},
         )
@@ -0,0 +1,26 @@
+"""
+Shared column mixins.
+
+created_at / updated_at are declared once here so every table gets the
+same type and server-side default (CLAUDE.md: server_default=func.now(),
+never default=datetime.now).
+"""
+from datetime import datetime
+from sqlalchemy import DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class TimestampMixin:
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class UpdatedAtMixin:
+    """Only for tables whose rows mutate (tasks). Append-only tables never get it."""
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -9,28 +9,34 @@ event_type values (see app/services/behavior_engine.py for full docs):
   "reset_day_protocol"  — 3 consecutive incomplete days (also creates a Task)
   "perfect_week"        — weekly_clarity_score == 1.0
 
-metadata: JSON-encoded dict stored as Text (no external deps).
+metadata: dict stored as JSONB on Postgres (JSON on SQLite).
 """
-from datetime import datetime, date
-from sqlalchemy import Integer, String, Text, DateTime, Date, func, UniqueConstraint
+from datetime import date
+from sqlalchemy import Integer, String, Date, text, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db.base import Base
+from app.db.base import Base, JSONType
+from app.models._mixins import TimestampMixin
 
 
-class BehaviorEvent(Base):
+class BehaviorEvent(TimestampMixin, Base):
     __tablename__ = "behavior_events"
     __table_args__ = (
         UniqueConstraint("event_type", "reference_date", name="uq_behavior_event_type_date"),
+        # GET /behavior/events lists newest first by (created_at, id),
+        # optionally filtered by type: both branches seek to the keyset
+        # anchor and read the page straight off index order (no sort).
+        Index(
+            "ix_behavior_event_type_created_at_id",
+            "event_type", text("created_at DESC"), text("id DESC"),
+        ),
+        Index("ix_behavior_event_created_at_id_desc", text("created_at DESC"), text("id DESC")),
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     event_type: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     reference_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
-    event_metadata: Mapped[str | None] = mapped_column(
-        "event_metadata", Text, nullable=True,
-        comment="JSON-encoded dict with context specific to each event_type",
-    )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+    event_metadata: Mapped[dict | None] = mapped_column(
+        "event_metadata", JSONType, nullable=True,
+        comment="Dict with context specific to each event_type",
     )
@@ -1,9 +1,10 @@
-from datetime import datetime, date
-from sqlalchemy import Integer, String, Text, DateTime, Date, Enum, func
+from datetime import date
+from sqlalchemy import Integer, String, Text, Date, Enum
 from sqlalchemy.orm import Mapped, mapped_column
 import enum
 
-from app.db.base import Base
+from app.db.base import Base, enum_values
+from app.models._mixins import TimestampMixin
 
 
 class EntryType(str, enum.Enum):
@@ -17,18 +18,17 @@ class EntryType(str, enum.Enum):
     unknown = "unknown"
 
 
-class Entry(Base):
+class Entry(TimestampMixin, Base):
     __tablename__ = "entries"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     raw: Mapped[str] = mapped_column(Text, nullable=False)
     entry_type: Mapped[str] = mapped_column(
-        Enum(EntryType, name="entry_type_enum"), nullable=False, default=EntryType.unknown
+        Enum(*enum_values(EntryType), name="entry_type_enum"),
+        nullable=False,
+        default=EntryType.unknown,
     )
     source: Mapped[str | None] = mapped_column(String(64), nullable=True)
-    day: Mapped[date] = mapped_column(Date, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     routed_to: Mapped[str | None] = mapped_column(String(64), nullable=True)
     rule_matched: Mapped[str | None] = mapped_column(String(128), nullable=True)
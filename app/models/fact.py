@@ -1,18 +1,16 @@
-from datetime import datetime, date
-from sqlalchemy import Integer, String, Text, DateTime, Date, func
+from datetime import date
+from sqlalchemy import Integer, String, Text, Date
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.models._mixins import TimestampMixin
 
 
-class Fact(Base):
+class Fact(TimestampMixin, Base):
     __tablename__ = "facts"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     entry_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     category: Mapped[str | None] = mapped_column(String(64), nullable=True)
-    day: Mapped[date] = mapped_column(Date, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
@@ -10,7 +10,7 @@ class MetricDaily(Base):
     __tablename__ = "metrics_daily"
     __table_args__ = (UniqueConstraint("name", "day", name="uq_metric_name_day"),)
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(128), nullable=False, index=True)
     value: Mapped[Decimal] = mapped_column(Numeric(18, 4), nullable=False)
     unit: Mapped[str | None] = mapped_column(String(32), nullable=True)
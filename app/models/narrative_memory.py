@@ -3,17 +3,18 @@ NarrativeMemory — derived projection of a day (or week) in human-readable form
 
 Rules (CLAUDE.md):
 - Append-only: no UPDATE or DELETE.
-- Columns that store lists are JSON-encoded Text (stdlib json, no new deps).
+- Columns that store lists are JSON (JSONB on Postgres); the driver decodes them.
 - The event store (entries) remains the source of truth; this table is a projection.
 """
-from datetime import datetime, date
-from sqlalchemy import Integer, String, Text, DateTime, Date, func, UniqueConstraint
+from datetime import date
+from sqlalchemy import Integer, String, Text, Date, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db.base import Base
+from app.db.base import Base, JSONType
+from app.models._mixins import TimestampMixin
 
 
-class NarrativeMemory(Base):
+class NarrativeMemory(TimestampMixin, Base):
     """
     Structured narrative snapshot compiled from a day's or week's raw events.
 
@@ -33,7 +34,7 @@ class NarrativeMemory(Base):
         UniqueConstraint("date", "snapshot_type", name="uq_narrative_date_type"),
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     snapshot_type: Mapped[str] = mapped_column(
         String(16), nullable=False, default="daily", index=True
@@ -41,20 +42,20 @@ class NarrativeMemory(Base):
 
     # Human-readable narrative fields
     summary: Mapped[str] = mapped_column(Text, nullable=False)
-    key_events: Mapped[str | None] = mapped_column(
-        Text, nullable=True,
+    key_events: Mapped[list[str] | None] = mapped_column(
+        JSONType, nullable=True,
         comment="JSON array of notable event strings",
     )
     emotional_state: Mapped[str | None] = mapped_column(
         String(128), nullable=True,
         comment="Heuristic tag(s) joined by '+': productive, quiet, financially_positive …",
     )
-    decisions_made: Mapped[str | None] = mapped_column(
-        Text, nullable=True,
+    decisions_made: Mapped[list[str] | None] = mapped_column(
+        JSONType, nullable=True,
         comment="JSON array of decision strings extracted from entries",
     )
-    lessons: Mapped[str | None] = mapped_column(
-        Text, nullable=True,
+    lessons: Mapped[list[str] | None] = mapped_column(
+        JSONType, nullable=True,
         comment="JSON array of lessons / facts worth remembering",
     )
     tags: Mapped[str | None] = mapped_column(
@@ -62,6 +63,3 @@ class NarrativeMemory(Base):
         comment="Comma-separated inferred tags (entry types present, topics)",
     )
 
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
@@ -8,21 +8,22 @@ period_type values:
   "daily"   — clarity for a single calendar day (bool: 1.0 or 0.0)
   "weekly"  — clarity score for a 7-day window ending at reference_date
 """
-from datetime import datetime, date
-from sqlalchemy import Integer, String, Numeric, DateTime, Date, func, UniqueConstraint
+from datetime import date
+from sqlalchemy import Integer, String, Numeric, Date, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 from decimal import Decimal
 
 from app.db.base import Base
+from app.models._mixins import TimestampMixin
 
 
-class NorthStarSnapshot(Base):
+class NorthStarSnapshot(TimestampMixin, Base):
     __tablename__ = "north_star_snapshots"
     __table_args__ = (
         UniqueConstraint("period_type", "reference_date", name="uq_north_star_period_date"),
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     period_type: Mapped[str] = mapped_column(
         String(16), nullable=False, index=True,
         comment='"daily" or "weekly"',
@@ -40,6 +41,3 @@ class NorthStarSnapshot(Base):
         Integer, nullable=False, default=1,
         comment="Window size; 1 for daily, 7 for weekly",
     )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
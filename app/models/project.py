@@ -1,9 +1,10 @@
-from datetime import datetime, date
-from sqlalchemy import Integer, String, Text, DateTime, Date, Enum, func
+from datetime import date
+from sqlalchemy import Integer, String, Text, Date, Enum
 from sqlalchemy.orm import Mapped, mapped_column
 import enum
 
-from app.db.base import Base
+from app.db.base import Base, enum_values
+from app.models._mixins import TimestampMixin
 
 
 class ProjectStatus(str, enum.Enum):
@@ -13,19 +14,16 @@ class ProjectStatus(str, enum.Enum):
     archived = "archived"
 
 
-class Project(Base):
+class Project(TimestampMixin, Base):
     __tablename__ = "projects"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(256), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(
-        Enum(ProjectStatus, name="project_status_enum"),
+        Enum(*enum_values(ProjectStatus), name="project_status_enum"),
         nullable=False,
         default=ProjectStatus.active,
     )
     start_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     end_date: Mapped[date | None] = mapped_column(Date, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
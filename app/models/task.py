@@ -1,9 +1,10 @@
-from datetime import datetime, date
-from sqlalchemy import Integer, String, Text, DateTime, Date, Enum, func
+from datetime import date
+from sqlalchemy import Integer, String, Text, Date, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column
 import enum
 
-from app.db.base import Base
+from app.db.base import Base, enum_values
+from app.models._mixins import TimestampMixin, UpdatedAtMixin
 
 
 class TaskStatus(str, enum.Enum):
@@ -13,27 +14,22 @@ class TaskStatus(str, enum.Enum):
     cancelled = "cancelled"
 
 
-class Task(Base):
+class Task(TimestampMixin, UpdatedAtMixin, Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # North-star "tasks done per day" over a window: one range scan.
+        Index("ix_tasks_status_day", "status", "day"),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     entry_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
     project_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
     title: Mapped[str] = mapped_column(String(256), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(
-        Enum(TaskStatus, name="task_status_enum"),
+        Enum(*enum_values(TaskStatus), name="task_status_enum"),
         nullable=False,
         default=TaskStatus.pending,
     )
     due_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
-        nullable=False,
-    )
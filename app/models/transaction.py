@@ -1,10 +1,11 @@
-from datetime import datetime, date
-from sqlalchemy import Integer, String, Text, Numeric, DateTime, Date, Enum, func
+from datetime import date
+from sqlalchemy import Integer, String, Text, Numeric, Date, Enum
 from sqlalchemy.orm import Mapped, mapped_column
 from decimal import Decimal
 import enum
 
-from app.db.base import Base
+from app.db.base import Base, enum_values
+from app.models._mixins import TimestampMixin
 
 
 class TransactionType(str, enum.Enum):
@@ -13,21 +14,18 @@ class TransactionType(str, enum.Enum):
     transfer = "transfer"
 
 
-class Transaction(Base):
+class Transaction(TimestampMixin, Base):
     __tablename__ = "transactions"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     entry_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
     amount: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
     currency: Mapped[str] = mapped_column(String(8), nullable=False, default="USD")
     tx_type: Mapped[str] = mapped_column(
-        Enum(TransactionType, name="transaction_type_enum"),
+        Enum(*enum_values(TransactionType), name="transaction_type_enum"),
         nullable=False,
         default=TransactionType.expense,
     )
     category: Mapped[str | None] = mapped_column(String(64), nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
@@ -1,44 +1,82 @@
 """
 Behavioral Engine router.
 
-GET /behavior/events   — list all behavior events (paginated, newest first)
+GET /behavior/events        — list behavior events (cursor-paginated, newest first)
+GET /behavior/events/count  — total number of events (full count; not for hot paths)
 """
 from __future__ import annotations
 
-import json
-from typing import Optional, Any
+import base64
+import binascii
+from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
+from app.core.errors import InvalidCursorError
 from app.db.base import get_db
 from app.models.behavior_event import BehaviorEvent
-from app.schemas.behavior import BehaviorEventListResponse, BehaviorEventResponse
-from app.services.behavior_engine import get_behavior_events, EventType
+from app.schemas.behavior import (
+    BehaviorEventCountResponse,
+    BehaviorEventListResponse,
+    BehaviorEventResponse,
+)
+from app.services.behavior_engine import (
+    behavior_event_exists,
+    count_behavior_events,
+    get_behavior_events,
+    EventType,
+)
+
+router = APIRouter(
+    prefix="/behavior",
+    tags=["behavior"],
+    default_response_class=ORJSONResponse,
+)
 
-router = APIRouter(prefix="/behavior", tags=["behavior"])
+_EVENT_TYPE_DESC = (
+    f'Filter by type: '
+    f'"{EventType.CLARITY_WARNING}", '
+    f'"{EventType.RESET_DAY_PROTOCOL}", '
+    f'"{EventType.PERFECT_WEEK}". '
+    "Omit for all."
+)
 
 
 # ---------------------------------------------------------------------------
-# Serialization helper
+# Serialization helpers
 # ---------------------------------------------------------------------------
 
-def _parse_metadata(raw: Optional[str]) -> Optional[dict[str, Any]]:
-    if not raw:
-        return None
+def _encode_cursor(event_id: int) -> str:
+    return base64.urlsafe_b64encode(str(event_id).encode()).rstrip(b"=").decode()
+
+
+# Ids are BIGINT-sized at most; anything outside can't name a row and would
+# overflow the driver's integer binding.
+_MAX_EVENT_ID = 2**63 - 1
+
+
+def _decode_cursor(cursor: str) -> int:
     try:
-        return json.loads(raw)
-    except (ValueError, TypeError):
-        return None
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        event_id = int(raw)
+    except (binascii.Error, ValueError):
+        raise InvalidCursorError() from None
+    if not 1 <= event_id <= _MAX_EVENT_ID:
+        raise InvalidCursorError()
+    return event_id
 
 
 def _event_to_response(ev: BehaviorEvent) -> BehaviorEventResponse:
-    return BehaviorEventResponse(
+    # Trusted ORM data: skip validation (it runs at the API input boundary only).
+    created_at = ev.created_at
+    return BehaviorEventResponse.model_construct(
         id=ev.id,
         event_type=ev.event_type,
-        reference_date=str(ev.reference_date),
-        metadata=_parse_metadata(ev.event_metadata),
-        created_at=ev.created_at.isoformat() if ev.created_at else "",
+        reference_date=ev.reference_date,
+        metadata=ev.event_metadata,
+        created_at=created_at.isoformat() if created_at else "",
     )
 
 
@@ -48,26 +86,25 @@ def _event_to_response(ev: BehaviorEvent) -> BehaviorEventResponse:
 
 @router.get(
     "/events",
-    response_model=BehaviorEventListResponse,
     summary="List behavioral engine events (newest first)",
     responses={
-        200: {"description": "Paginated list of system reaction events."},
+        200: {
+            "model": BehaviorEventListResponse,
+            "description": "Paginated list of system reaction events.",
+        },
     },
 )
 def list_behavior_events(
     event_type: Optional[str] = Query(
         default=None,
-        description=(
-            f'Filter by type: '
-            f'"{EventType.CLARITY_WARNING}", '
-            f'"{EventType.RESET_DAY_PROTOCOL}", '
-            f'"{EventType.PERFECT_WEEK}". '
-            "Omit for all."
-        ),
+        description=_EVENT_TYPE_DESC,
         examples=["clarity_warning"],
     ),
     limit: int = Query(default=50, ge=1, le=200, description="Page size."),
-    offset: int = Query(default=0, ge=0, description="Skip N items."),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="`next_cursor` from the previous page. Omit for the first page.",
+    ),
     db: Session = Depends(get_db),
 ):
     """
@@ -81,11 +118,41 @@ def list_behavior_events(
     | `perfect_week`       | all 7 days complete (score == 1.0) |
 
     Events are idempotent: at most one per (event_type, reference_date).
+
+    Pages are keyset-paginated: pass `next_cursor` back as `cursor` until it
+    is null. Use `GET /behavior/events/count` when a total is needed.
     """
-    total, items = get_behavior_events(
-        db=db, event_type=event_type, limit=limit, offset=offset
+    before_id = _decode_cursor(cursor) if cursor else None
+    items, has_more = get_behavior_events(
+        db=db, event_type=event_type, limit=limit, before_id=before_id
     )
-    return BehaviorEventListResponse(
-        total=total,
+    # A missing anchor makes the keyset comparison NULL, which would look
+    # like the end of the list; only pay for the check on an empty page.
+    if before_id is not None and not items and not behavior_event_exists(db, before_id):
+        raise InvalidCursorError()
+    # Returned as a ready Response: FastAPI skips response_model re-validation
+    # and jsonable_encoder; orjson encodes the plain dump directly.
+    resp = BehaviorEventListResponse.model_construct(
+        next_cursor=_encode_cursor(items[-1].id) if has_more else None,
         items=[_event_to_response(ev) for ev in items],
     )
+    return ORJSONResponse(content=resp.model_dump())
+
+
+# ---------------------------------------------------------------------------
+# GET /behavior/events/count
+# ---------------------------------------------------------------------------
+
+@router.get(
+    "/events/count",
+    response_model=BehaviorEventCountResponse,
+    summary="Count behavioral engine events",
+)
+def count_events(
+    event_type: Optional[str] = Query(default=None, description=_EVENT_TYPE_DESC),
+    db: Session = Depends(get_db),
+):
+    """Full COUNT(*) over the matching events — costs a scan; not meant for polling."""
+    return BehaviorEventCountResponse(
+        total=count_behavior_events(db=db, event_type=event_type)
+    )
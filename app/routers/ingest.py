@@ -6,12 +6,23 @@ POST /ingest/batch    — batch of up to 100 entries
 """
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from operator import attrgetter
+from typing import Any, Callable
+
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.orm import Session
 
 from app.db.base import get_db
 from app.schemas.domain import (
-    TaskOut, TransactionOut, FactOut, MetricOut, ProjectOut, RoutedEntityOut,
+    FactOut,
+    MetricOut,
+    ProjectOut,
+    RoutedEntityOut,
+    TaskOut,
+    TransactionOut,
 )
 from app.schemas.ingest import (
     BatchIngestRequest,
@@ -36,9 +47,89 @@ router = APIRouter(prefix="/ingest", tags=["ingest"])
 # Serialization helper
 # ---------------------------------------------------------------------------
 
-def _ev(v) -> str:
+def _ev(v, _value=attrgetter("value")) -> str:
     """Extract bare string value from a str-enum or plain str."""
-    return v.value if hasattr(v, "value") else str(v)
+    return v if v.__class__ is str else _value(v)
+
+
+# One C-level attrgetter call per entity instead of one LOAD_ATTR per field.
+_TASK_GET = attrgetter("id", "title", "status", "day", "due_date", "project_id")
+_TX_GET = attrgetter("id", "amount", "currency", "tx_type", "category", "description", "day")
+_FACT_GET = attrgetter("id", "content", "category", "day")
+_METRIC_GET = attrgetter("id", "name", "value", "unit", "day")
+_PROJECT_GET = attrgetter("id", "name", "status", "start_date")
+
+
+def _task_dict(entity: Task) -> dict[str, Any]:
+    id_, title, status_, day, due_date, project_id = _TASK_GET(entity)
+    return {
+        "type": "task",
+        "id": id_,
+        "title": title,
+        "status": _ev(status_),
+        "day": day,
+        "due_date": due_date,
+        "project_id": project_id,
+    }
+
+
+def _transaction_dict(entity: Transaction) -> dict[str, Any]:
+    id_, amount, currency, tx_type, category, description, day = _TX_GET(entity)
+    return {
+        "type": "transaction",
+        "id": id_,
+        "amount": str(amount),
+        "currency": currency,
+        "tx_type": _ev(tx_type),
+        "category": category,
+        "description": description,
+        "day": day,
+    }
+
+
+def _fact_dict(entity: Fact) -> dict[str, Any]:
+    id_, content, category, day = _FACT_GET(entity)
+    return {
+        "type": "fact",
+        "id": id_,
+        "content": content,
+        "category": category,
+        "day": day,
+    }
+
+
+def _metric_dict(entity: MetricDaily) -> dict[str, Any]:
+    id_, name, value, unit, day = _METRIC_GET(entity)
+    return {
+        "type": "metric",
+        "id": id_,
+        "name": name,
+        "value": str(value),
+        "unit": unit,
+        "day": day,
+    }
+
+
+def _project_dict(entity: Project) -> dict[str, Any]:
+    id_, name, status_, start_date = _PROJECT_GET(entity)
+    return {
+        "type": "project",
+        "id": id_,
+        "name": name,
+        "status": _ev(status_),
+        "start_date": start_date,
+    }
+
+
+# Exact-type dispatch: one dict lookup instead of an isinstance chain.
+# The ORM type already fixes the output subtype, so no union matching is needed.
+_BUILDERS: dict[type, tuple[type[BaseModel], Callable[[Any], dict[str, Any]]]] = {
+    Task: (TaskOut, _task_dict),
+    Transaction: (TransactionOut, _transaction_dict),
+    Fact: (FactOut, _fact_dict),
+    MetricDaily: (MetricOut, _metric_dict),
+    Project: (ProjectOut, _project_dict),
+}
 
 
 def _build_routed_entity(ir: IngestResult) -> RoutedEntityOut | None:
@@ -46,61 +137,24 @@ def _build_routed_entity(ir: IngestResult) -> RoutedEntityOut | None:
     entity = ir.domain_entity
     if entity is None:
         return None
-
-    if isinstance(entity, Task):
-        return TaskOut(
-            id=entity.id,
-            title=entity.title,
-            status=_ev(entity.status),
-            day=str(entity.day),
-            due_date=str(entity.due_date) if entity.due_date else None,
-            project_id=entity.project_id,
-        )
-    if isinstance(entity, Transaction):
-        return TransactionOut(
-            id=entity.id,
-            amount=str(entity.amount),
-            currency=entity.currency,
-            tx_type=_ev(entity.tx_type),
-            category=entity.category,
-            description=entity.description,
-            day=str(entity.day),
-        )
-    if isinstance(entity, Fact):
-        return FactOut(
-            id=entity.id,
-            content=entity.content,
-            category=entity.category,
-            day=str(entity.day),
-        )
-    if isinstance(entity, MetricDaily):
-        return MetricOut(
-            id=entity.id,
-            name=entity.name,
-            value=str(entity.value),
-            unit=entity.unit,
-            day=str(entity.day),
-        )
-    if isinstance(entity, Project):
-        return ProjectOut(
-            id=entity.id,
-            name=entity.name,
-            status=_ev(entity.status),
-            start_date=str(entity.start_date) if entity.start_date else None,
-        )
-    return None
+    spec = _BUILDERS.get(type(entity))
+    if spec is None:
+        return None
+    schema, builder = spec
+    return schema.model_construct(**builder(entity))
 
 
 def _ir_to_response(ir: IngestResult) -> IngestResponse:
     entry = ir.entry
-    return IngestResponse(
+    # Trusted ORM data: skip validation (it runs at the API input boundary only).
+    return IngestResponse.model_construct(
         id=entry.id,
         raw=entry.raw,
         entry_type=_ev(entry.entry_type),
         source=_ev(entry.source) if entry.source else None,
         routed_to=entry.routed_to,
         rule_matched=entry.rule_matched,
-        day=str(entry.day),
+        day=entry.day,
         created_at=entry.created_at.isoformat() if entry.created_at else "",
         routed_entity=_build_routed_entity(ir),
     )
@@ -137,13 +191,58 @@ def ingest(payload: IngestRequest, db: Session = Depends(get_db)):
     except Exception as exc:
         raise EntryIngestionError(message=str(exc), raw=payload.raw) from exc
 
-    return _ir_to_response(ir)
+    # Ready Response: one serializer pass, no response_model re-validation.
+    return ORJSONResponse(
+        content=_ir_to_response(ir).model_dump(), status_code=status.HTTP_201_CREATED
+    )
 
 
 # ---------------------------------------------------------------------------
 # POST /ingest/batch
 # ---------------------------------------------------------------------------
 
+def _is_json(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type == "application/json" or (
+        media_type.startswith("application/") and media_type.endswith("+json")
+    )
+
+
+async def _batch_payload(request: Request) -> BatchIngestRequest:
+    """
+    Parse and validate the raw body in one pydantic-core pass.
+
+    FastAPI would json.loads() the body and then validate the Python
+    objects; model_validate_json does both in Rust. Errors are re-raised
+    as RequestValidationError so the usual 422 envelope applies. As with a
+    typed body parameter, a missing Content-Type is read as JSON and any
+    non-JSON one is rejected.
+    """
+    content_type = request.headers.get("content-type")
+    if content_type is not None and not _is_json(content_type):
+        raise RequestValidationError([{
+            "type": "content_type",
+            "loc": ("body",),
+            "msg": "Content-Type must be application/json",
+            "input": content_type,
+        }])
+    try:
+        return BatchIngestRequest.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors(include_url=False)) from exc
+
+
+# The body is read by _batch_payload, so FastAPI doesn't see the model: its
+# schema and nested definitions are registered as OpenAPI components by
+# app.main (see OPENAPI_COMPONENTS) and the request body refers to them.
+_COMPONENT_REF = "#/components/schemas/{model}"
+_batch_schema = BatchIngestRequest.model_json_schema(ref_template=_COMPONENT_REF)
+OPENAPI_COMPONENTS: dict[str, dict[str, Any]] = {
+    **_batch_schema.pop("$defs", {}),
+    BatchIngestRequest.__name__: _batch_schema,
+}
+
+
 @router.post(
     "/batch",
     response_model=BatchIngestResponse,
@@ -153,16 +252,25 @@ def ingest(payload: IngestRequest, db: Session = Depends(get_db)):
         207: {"description": "Multi-status: check each item's `ok` field."},
         422: {"description": "Batch-level validation error (empty list, too many items)."},
     },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {
+                "$ref": _COMPONENT_REF.format(model=BatchIngestRequest.__name__),
+            }}},
+        },
+    },
 )
 def ingest_batch_endpoint(
-    payload: BatchIngestRequest,
+    payload: BatchIngestRequest = Depends(_batch_payload),
     db: Session = Depends(get_db),
 ):
     """
     Ingest up to **100 entries** in a single request.
 
-    Each item is processed independently using a database savepoint.
-    A failure on one item does not roll back others.
+    Items are routed and inserted in bulk; if any insert fails, the batch is
+    replayed one savepoint per item. A failure on one item does not roll
+    back others.
 
     Item-level `source` and `day` override the batch-level defaults.
     Response HTTP status is **207 Multi-Status** — always inspect each `item.ok`.
@@ -182,20 +290,26 @@ def ingest_batch_endpoint(
 
     raw_results = ingest_batch(service_items, db)
 
-    item_results: list[BatchItemResult] = [
-        BatchItemResult(
+    # Single pass: build items and count successes together.
+    succeeded = 0
+    item_results: list[BatchItemResult] = []
+    for r in raw_results:
+        ok = r["ok"]
+        succeeded += ok
+        item_results.append(BatchItemResult.model_construct(
             index=r["index"],
-            ok=r["ok"],
-            entry=_ir_to_response(r["result"]) if r["ok"] and r["result"] else None,
+            ok=ok,
+            entry=_ir_to_response(r["result"]) if ok and r["result"] else None,
             error=r["error"],
-        )
-        for r in raw_results
-    ]
+        ))
 
-    succeeded = sum(1 for r in item_results if r.ok)
-    return BatchIngestResponse(
+    resp = BatchIngestResponse.model_construct(
         total=len(item_results),
         succeeded=succeeded,
         failed=len(item_results) - succeeded,
         items=item_results,
     )
+    # Ready Response: skips response_model re-validation and jsonable_encoder.
+    return ORJSONResponse(
+        content=resp.model_dump(), status_code=status.HTTP_207_MULTI_STATUS
+    )
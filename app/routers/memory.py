@@ -8,8 +8,8 @@ GET  /memory/snapshots/{id} — Single snapshot by ID
 """
 from __future__ import annotations
 
-import json
 from datetime import date
+from operator import attrgetter
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, status
@@ -23,7 +23,12 @@ from app.schemas.memory import (
     NarrativeMemoryListResponse,
     NarrativeMemoryResponse,
 )
-from app.services.memory import compile_day_memory, compile_week_memory, get_snapshots
+from app.services.memory import (
+    compile_day_memory,
+    compile_week_memory,
+    get_snapshots,
+    split_tags,
+)
 from app.core.errors import DIOSException
 
 router = APIRouter(prefix="/memory", tags=["memory"])
@@ -33,32 +38,29 @@ router = APIRouter(prefix="/memory", tags=["memory"])
 # Serialization helper
 # ---------------------------------------------------------------------------
 
+_SNAP_GET = attrgetter(
+    "id", "date", "snapshot_type", "summary", "key_events", "emotional_state",
+    "decisions_made", "lessons", "tags", "created_at",
+)
+
+
 def _snap_to_response(snap: NarrativeMemory) -> NarrativeMemoryResponse:
-    def _parse_list(text: Optional[str]) -> list[str]:
-        if not text:
-            return []
-        try:
-            result = json.loads(text)
-            return result if isinstance(result, list) else []
-        except (ValueError, TypeError):
-            return []
-
-    def _parse_tags(text: Optional[str]) -> list[str]:
-        if not text:
-            return []
-        return [t.strip() for t in text.split(",") if t.strip()]
-
-    return NarrativeMemoryResponse(
-        id=snap.id,
-        date=str(snap.date),
-        snapshot_type=snap.snapshot_type,
-        summary=snap.summary,
-        key_events=_parse_list(snap.key_events),
-        emotional_state=snap.emotional_state,
-        decisions_made=_parse_list(snap.decisions_made),
-        lessons=_parse_list(snap.lessons),
-        tags=_parse_tags(snap.tags),
-        created_at=snap.created_at.isoformat() if snap.created_at else "",
+    (
+        id_, day, snapshot_type, summary, key_events, emotional_state,
+        decisions_made, lessons, tags, created_at,
+    ) = _SNAP_GET(snap)
+    # Trusted ORM data: skip validation (it runs at the API input boundary only).
+    return NarrativeMemoryResponse.model_construct(
+        id=id_,
+        date=day,
+        snapshot_type=snapshot_type,
+        summary=summary,
+        key_events=key_events or [],
+        emotional_state=emotional_state,
+        decisions_made=decisions_made or [],
+        lessons=lessons or [],
+        tags=split_tags(tags),
+        created_at=created_at.isoformat() if created_at else "",
     )
 
 
@@ -161,7 +163,7 @@ def list_snapshots(
 ):
     """Return a paginated list of narrative memory snapshots ordered by date (newest first)."""
     total, items = get_snapshots(db=db, snapshot_type=snapshot_type, limit=limit, offset=offset)
-    return NarrativeMemoryListResponse(
+    return NarrativeMemoryListResponse.model_construct(
         total=total,
         items=[_snap_to_response(s) for s in items],
     )
@@ -182,7 +184,7 @@ def list_snapshots(
 )
 def get_snapshot(snapshot_id: int, db: Session = Depends(get_db)):
     """Retrieve a specific narrative memory snapshot by its database ID."""
-    snap = db.query(NarrativeMemory).filter(NarrativeMemory.id == snapshot_id).first()
+    snap = db.get(NarrativeMemory, snapshot_id)
     if snap is None:
         raise NarrativeNotFoundError(snapshot_id=snapshot_id)
     return _snap_to_response(snap)
@@ -33,8 +33,9 @@ router = APIRouter(prefix="/metrics", tags=["metrics"])
 # ---------------------------------------------------------------------------
 
 def _daily_to_response(d: DailyClarity) -> DailyClarityResponse:
-    return DailyClarityResponse(
-        day=str(d.day),
+    # Trusted service data: skip validation (it runs at the API input boundary only).
+    return DailyClarityResponse.model_construct(
+        day=d.day,
         is_complete=d.is_complete,
         event_count=d.event_count,
         has_outcome=d.has_outcome,
@@ -43,8 +44,8 @@ def _daily_to_response(d: DailyClarity) -> DailyClarityResponse:
 
 
 def _weekly_to_response(w: WeeklyClarity) -> NorthStarResponse:
-    return NorthStarResponse(
-        reference_date=str(w.reference_date),
+    return NorthStarResponse.model_construct(
+        reference_date=w.reference_date,
         weekly_clarity_score=float(w.clarity_score),
         complete_days=w.complete_days,
         total_days=w.total_days,
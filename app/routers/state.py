@@ -13,8 +13,7 @@ from sqlalchemy.orm import Session
 
 from app.db.base import get_db
 from app.schemas.state import CloseDayRequest, DailyLogResponse
-from app.services.state import get_state_today, get_state_active, close_day
-from app.models.daily_log import DailyLog
+from app.services.state import get_state_today, get_state_active, close_day, get_daily_log
 from app.core.errors import DayAlreadyClosedError
 
 router = APIRouter(prefix="/state", tags=["state"])
@@ -65,17 +64,15 @@ def state_close_day(payload: CloseDayRequest, db: Session = Depends(get_db)):
 
     Raises **409** if the day is already closed.
     """
-    target = payload.day or date.today()
-    existing: Optional[DailyLog] = (
-        db.query(DailyLog).filter(DailyLog.day == target).first()
-    )
+    existing = get_daily_log(db, payload.day)
     if existing and existing.is_closed:
         raise DayAlreadyClosedError(day=existing.day)
 
     log = close_day(db=db, day=payload.day, summary=payload.summary)
-    return DailyLogResponse(
+    # Trusted ORM data: skip validation (it runs at the API input boundary only).
+    return DailyLogResponse.model_construct(
         id=log.id,
-        day=str(log.day),
+        day=log.day,
         is_closed=log.is_closed,
         total_entries=log.total_entries,
         total_tasks=log.total_tasks,
@@ -1,20 +1,22 @@
 """
 Behavioral Engine response schemas.
 
-GET /behavior/events → BehaviorEventListResponse
+GET /behavior/events       → BehaviorEventListResponse
+GET /behavior/events/count → BehaviorEventCountResponse
 """
+from datetime import date
 from typing import Any, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 
 class BehaviorEventResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     event_type: str = Field(
         description='"clarity_warning" | "reset_day_protocol" | "perfect_week"'
     )
-    reference_date: str = Field(description="ISO date that triggered this event.")
+    reference_date: date = Field(description="ISO date that triggered this event.")
     metadata: Optional[dict[str, Any]] = Field(
         default=None,
         description="Context specific to each event_type.",
@@ -23,5 +25,16 @@ class BehaviorEventResponse(BaseModel):
 
 
 class BehaviorEventListResponse(BaseModel):
-    total: int
+    model_config = ConfigDict(frozen=True)
+
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the next page; null on the last page.",
+    )
     items: list[BehaviorEventResponse]
+
+
+class BehaviorEventCountResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    total: int
@@ -2,24 +2,25 @@
 Typed output schemas for each domain entity returned inside IngestResponse.
 Each schema corresponds to one domain table fan-out.
 """
-from typing import Literal, Optional, Union
-from pydantic import BaseModel, ConfigDict
+from datetime import date
+from typing import Annotated, Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TaskOut(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     type: Literal["task"] = "task"
     id: int
     title: str
     status: str
-    day: str
-    due_date: Optional[str] = None
+    day: date
+    due_date: Optional[date] = None
     project_id: Optional[int] = None
 
 
 class TransactionOut(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     type: Literal["transaction"] = "transaction"
     id: int
@@ -28,39 +29,42 @@ class TransactionOut(BaseModel):
     tx_type: str
     category: Optional[str] = None
     description: Optional[str] = None
-    day: str
+    day: date
 
 
 class FactOut(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     type: Literal["fact"] = "fact"
     id: int
     content: str
     category: Optional[str] = None
-    day: str
+    day: date
 
 
 class MetricOut(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     type: Literal["metric"] = "metric"
     id: int
     name: str
     value: str
     unit: Optional[str] = None
-    day: str
+    day: date
 
 
 class ProjectOut(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     type: Literal["project"] = "project"
     id: int
     name: str
     status: str
-    start_date: Optional[str] = None
+    start_date: Optional[date] = None
 
 
 # Discriminated union — FastAPI serializes this with the correct subtype
-RoutedEntityOut = Union[TaskOut, TransactionOut, FactOut, MetricOut, ProjectOut]
+RoutedEntityOut = Annotated[
+    Union[TaskOut, TransactionOut, FactOut, MetricOut, ProjectOut],
+    Field(discriminator="type"),
+]
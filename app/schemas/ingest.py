@@ -10,7 +10,7 @@ import enum
 from datetime import date
 from typing import Annotated, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from app.schemas.domain import RoutedEntityOut
 
@@ -38,9 +38,10 @@ class IngestRequest(BaseModel):
     """A single raw-text entry to ingest."""
     model_config = ConfigDict(use_enum_values=True)
 
-    raw: Annotated[str, Field(
-        min_length=1,
-        max_length=10_000,
+    # Stripped and length-checked inside pydantic-core (no Python validator).
+    raw: Annotated[str, StringConstraints(
+        strip_whitespace=True, min_length=1, max_length=10_000
+    ), Field(
         description="Raw free-text entry. Stripped of leading/trailing whitespace.",
         examples=["TODO: revisar el PR de Ana", "gasté $45 en almuerzo"],
     )]
@@ -55,18 +56,10 @@ class IngestRequest(BaseModel):
         examples=["2026-02-20"],
     )
 
-    @field_validator("raw", mode="before")
-    @classmethod
-    def strip_and_check_empty(cls, v: str) -> str:
-        stripped = v.strip() if isinstance(v, str) else v
-        if not stripped:
-            raise ValueError("raw text must not be empty after stripping whitespace")
-        return stripped
-
 
 class IngestResponse(BaseModel):
     """Result of ingesting a single entry."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int = Field(description="ID in the entries table.")
     raw: str = Field(description="Stripped raw text as stored.")
@@ -74,7 +67,7 @@ class IngestResponse(BaseModel):
     source: Optional[str] = Field(default=None, description="Source channel.")
     routed_to: Optional[str] = Field(default=None, description="Target domain table.")
     rule_matched: Optional[str] = Field(default=None, description="Rule name that matched.")
-    day: str = Field(description="ISO date of the entry.")
+    day: date = Field(description="ISO date of the entry.")
     created_at: str = Field(description="UTC timestamp of creation.")
     routed_entity: Optional[RoutedEntityOut] = Field(
         default=None,
@@ -111,16 +104,11 @@ class BatchIngestRequest(BaseModel):
         description="Default date for all items that omit `day`.",
     )
 
-    @field_validator("items")
-    @classmethod
-    def check_not_empty(cls, v: list) -> list:
-        if not v:
-            raise ValueError("items must contain at least one entry")
-        return v
-
 
 class BatchItemResult(BaseModel):
     """Outcome for a single item in a batch request."""
+    model_config = ConfigDict(frozen=True)
+
     index: int = Field(description="Zero-based position in the request items list.")
     ok: bool = Field(description="True if the item was ingested successfully.")
     entry: Optional[IngestResponse] = Field(
@@ -135,6 +123,8 @@ class BatchItemResult(BaseModel):
 
 class BatchIngestResponse(BaseModel):
     """Summary of a batch ingest operation."""
+    model_config = ConfigDict(frozen=True)
+
     total: int = Field(description="Total items received.")
     succeeded: int = Field(description="Items ingested successfully.")
     failed: int = Field(description="Items that failed.")
@@ -7,6 +7,7 @@ GET  /memory/snapshots     → list[NarrativeMemoryResponse]
 """
 from __future__ import annotations
 
+import datetime as dt
 from datetime import date
 from typing import Annotated, Optional
 
@@ -35,10 +36,10 @@ class CompileWeekRequest(BaseModel):
 
 class NarrativeMemoryResponse(BaseModel):
     """A structured narrative snapshot (daily or weekly)."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
-    date: str = Field(description="ISO date this snapshot covers (or week start for weekly).")
+    date: dt.date = Field(description="ISO date this snapshot covers (or week start for weekly).")
     snapshot_type: str = Field(description='"daily" or "weekly".')
     summary: str = Field(description="One-paragraph human-readable narrative of the period.")
     key_events: list[str] = Field(
@@ -66,5 +67,7 @@ class NarrativeMemoryResponse(BaseModel):
 
 class NarrativeMemoryListResponse(BaseModel):
     """Paginated list of narrative snapshots."""
+    model_config = ConfigDict(frozen=True)
+
     total: int
     items: list[NarrativeMemoryResponse]
@@ -11,9 +11,9 @@ from pydantic import BaseModel, ConfigDict, Field
 
 class DailyClarityResponse(BaseModel):
     """Breakdown of a single day's Complete Day evaluation."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    day: str
+    day: date
     is_complete: bool
     event_count: int = Field(description="Number of entries logged this day.")
     has_outcome: bool = Field(
@@ -26,9 +26,9 @@ class DailyClarityResponse(BaseModel):
 
 class NorthStarResponse(BaseModel):
     """Clarity Score for the 7-day window ending on reference_date."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    reference_date: str = Field(
+    reference_date: date = Field(
         description="Last day (inclusive) of the 7-day evaluation window."
     )
     weekly_clarity_score: float = Field(
@@ -1,6 +1,6 @@
 from datetime import date
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CloseDayRequest(BaseModel):
@@ -9,8 +9,10 @@ class CloseDayRequest(BaseModel):
 
 
 class DailyLogResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
-    day: str
+    day: date
     is_closed: bool
     total_entries: int
     total_tasks: int
@@ -18,6 +20,3 @@ class DailyLogResponse(BaseModel):
     total_facts: int
     summary: Optional[str]
     closed_at: Optional[str]
-
-    class Config:
-        from_attributes = True
@@ -19,20 +19,20 @@ Rules (evaluated every time GET /metrics/north-star is called)
 Idempotency
 -----------
 Each (event_type, reference_date) pair is unique in `behavior_events`.
-Before emitting, the engine checks whether that pair already exists.
+Before emitting, the engine reads which pairs already exist (one query).
 If it does, the rule is skipped — no duplicate events, no duplicate tasks.
 
 Zero LLM, no HTTP, stdlib-only. db.commit() called once at the end.
 """
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session, aliased
 from sqlalchemy.exc import IntegrityError
 
 from app.models.behavior_event import BehaviorEvent
@@ -52,6 +52,7 @@ class EventType:
 
 # Thresholds
 _CLARITY_WARNING_THRESHOLD = Decimal("0.4")
+_PERFECT_SCORE             = Decimal("1.0")
 _CONSECUTIVE_INCOMPLETE    = 3
 
 
@@ -72,16 +73,21 @@ class EngineResult:
 # Idempotency helpers
 # ---------------------------------------------------------------------------
 
-def _event_exists(db: Session, event_type: str, ref_date: date) -> bool:
-    return (
-        db.query(BehaviorEvent.id)
-        .filter(
-            BehaviorEvent.event_type == event_type,
+_ENGINE_EVENT_TYPES = (
+    EventType.CLARITY_WARNING,
+    EventType.RESET_DAY_PROTOCOL,
+    EventType.PERFECT_WEEK,
+)
+
+
+def _existing_events(db: Session, ref_date: date) -> set[str]:
+    """Engine event types already recorded for ref_date, in one query."""
+    return set(db.scalars(
+        select(BehaviorEvent.event_type).where(
             BehaviorEvent.reference_date == ref_date,
+            BehaviorEvent.event_type.in_(_ENGINE_EVENT_TYPES),
         )
-        .first()
-        is not None
-    )
+    ))
 
 
 def _emit(
@@ -89,17 +95,18 @@ def _emit(
     event_type: str,
     ref_date: date,
     meta: dict,
+    existing: set[str],
 ) -> bool:
     """
     Try to insert a BehaviorEvent. Returns True if inserted, False if skipped.
     Uses the DB unique constraint as the final idempotency guard.
     """
-    if _event_exists(db, event_type, ref_date):
+    if event_type in existing:
         return False
     db.add(BehaviorEvent(
         event_type=event_type,
         reference_date=ref_date,
-        event_metadata=json.dumps(meta, default=str),
+        event_metadata=meta,
     ))
     return True
 
@@ -112,6 +119,7 @@ def _rule_clarity_warning(
     db: Session,
     weekly: WeeklyClarity,
     result: EngineResult,
+    existing: set[str],
 ) -> None:
     """Rule 1: score < 0.4 → clarity_warning event."""
     if weekly.clarity_score >= _CLARITY_WARNING_THRESHOLD:
@@ -125,6 +133,7 @@ def _rule_clarity_warning(
             "total_days": weekly.total_days,
             "threshold": str(_CLARITY_WARNING_THRESHOLD),
         },
+        existing=existing,
     )
     if inserted:
         result.events_created.append(event_type)
@@ -136,19 +145,18 @@ def _rule_reset_day_protocol(
     db: Session,
     weekly: WeeklyClarity,
     result: EngineResult,
+    existing: set[str],
 ) -> None:
     """
     Rule 2: last N consecutive days all incomplete → reset_day_protocol event
     + Task "Reset Day Protocol".
     """
     tail: list[DailyClarity] = weekly.days[-_CONSECUTIVE_INCOMPLETE:]
-    if len(tail) < _CONSECUTIVE_INCOMPLETE:
-        return
-    if not all(not d.is_complete for d in tail):
+    if len(tail) < _CONSECUTIVE_INCOMPLETE or any(d.is_complete for d in tail):
         return
 
     event_type = EventType.RESET_DAY_PROTOCOL
-    if _event_exists(db, event_type, weekly.reference_date):
+    if event_type in existing:
         result.events_skipped.append(event_type)
         return
 
@@ -168,11 +176,11 @@ def _rule_reset_day_protocol(
     db.add(BehaviorEvent(
         event_type=event_type,
         reference_date=weekly.reference_date,
-        event_metadata=json.dumps({
+        event_metadata={
             "consecutive_incomplete_days": _CONSECUTIVE_INCOMPLETE,
             "incomplete_days": [str(d.day) for d in tail],
             "task_id": task.id,
-        }),
+        },
     ))
     result.events_created.append(event_type)
     result.task_created = True
@@ -182,9 +190,10 @@ def _rule_perfect_week(
     db: Session,
     weekly: WeeklyClarity,
     result: EngineResult,
+    existing: set[str],
 ) -> None:
     """Rule 3: score == 1.0 → perfect_week event."""
-    if weekly.clarity_score < Decimal("1.0"):
+    if weekly.clarity_score < _PERFECT_SCORE:
         return
     event_type = EventType.PERFECT_WEEK
     inserted = _emit(
@@ -194,6 +203,7 @@ def _rule_perfect_week(
             "complete_days": weekly.complete_days,
             "total_days": weekly.total_days,
         },
+        existing=existing,
     )
     if inserted:
         result.events_created.append(event_type)
@@ -218,9 +228,10 @@ def evaluate_and_react(db: Session, weekly: WeeklyClarity) -> EngineResult:
         task_created=False,
     )
 
-    _rule_clarity_warning(db, weekly, result)
-    _rule_reset_day_protocol(db, weekly, result)
-    _rule_perfect_week(db, weekly, result)
+    existing = _existing_events(db, weekly.reference_date)
+    _rule_clarity_warning(db, weekly, result, existing)
+    _rule_reset_day_protocol(db, weekly, result, existing)
+    _rule_perfect_week(db, weekly, result, existing)
 
     if result.events_created:
         try:
@@ -240,17 +251,40 @@ def get_behavior_events(
     db: Session,
     event_type: Optional[str] = None,
     limit: int = 50,
-    offset: int = 0,
-) -> tuple[int, list[BehaviorEvent]]:
-    """Return (total, page) of BehaviorEvents ordered by created_at desc."""
-    q = db.query(BehaviorEvent)
+    before_id: Optional[int] = None,
+) -> tuple[list[BehaviorEvent], bool]:
+    """
+    Return (page, has_more) of BehaviorEvents ordered by (created_at, id) desc.
+
+    Keyset pagination: `before_id` is the last event of the previous page and
+    the page starts strictly after it in that order. The anchor's key is read
+    in the same statement, so timestamps never round-trip through Python.
+    No COUNT(*) — see count_behavior_events().
+    """
+    stmt = select(BehaviorEvent)
     if event_type:
-        q = q.filter(BehaviorEvent.event_type == event_type)
-    total = q.count()
-    items = (
-        q.order_by(BehaviorEvent.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
-    return total, items
+        stmt = stmt.where(BehaviorEvent.event_type == event_type)
+    if before_id is not None:
+        anchor = aliased(BehaviorEvent)
+        stmt = stmt.where(
+            tuple_(BehaviorEvent.created_at, BehaviorEvent.id)
+            < select(anchor.created_at, anchor.id)
+            .where(anchor.id == before_id)
+            .scalar_subquery()
+        )
+    stmt = stmt.order_by(BehaviorEvent.created_at.desc(), BehaviorEvent.id.desc())
+    rows = list(db.scalars(stmt.limit(limit + 1)))
+    return rows[:limit], len(rows) > limit
+
+
+def behavior_event_exists(db: Session, event_id: int) -> bool:
+    """Whether a BehaviorEvent with this id exists (e.g. a cursor anchor)."""
+    return db.scalar(select(BehaviorEvent.id).where(BehaviorEvent.id == event_id)) is not None
+
+
+def count_behavior_events(db: Session, event_type: Optional[str] = None) -> int:
+    """COUNT(*) of BehaviorEvents, optionally by type. Scans the match set."""
+    stmt = select(func.count(BehaviorEvent.id))
+    if event_type:
+        stmt = stmt.where(BehaviorEvent.event_type == event_type)
+    return db.scalar(stmt) or 0
@@ -4,11 +4,13 @@ Ingest service: routes and persists entries, fans out to domain tables.
 Public API
 ----------
 ingest_raw(raw, db, source, day)   → IngestResult   (single, transactional)
-ingest_batch(items, db)            → list[dict]      (per-item savepoints)
+ingest_batch(items, db)            → list[dict]      (bulk insert, per-item fallback)
 
 Internal
 --------
-_ingest_one(raw, db, source, day)  → IngestResult   (flush only, no commit)
+_ingest_one(raw, db, source, day, default_day)  → IngestResult   (flush only, no commit)
+_ingest_bulk(items, db, default_day, loaded)    → list[dict]      (bulk INSERT ... RETURNING)
+_ingest_each(items, db, default_day)            → list[dict]      (per-item savepoints)
 """
 from __future__ import annotations
 
@@ -16,8 +18,9 @@ import re
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.models.entry import Entry, EntryType
@@ -26,7 +29,12 @@ from app.models.metric import MetricDaily
 from app.models.transaction import Transaction, TransactionType
 from app.models.task import Task, TaskStatus
 from app.models.project import Project, ProjectStatus
-from app.services.router import route_entry, RoutingResult
+from app.services.router import (
+    RoutingResult,
+    load_active_rules,
+    route_entry,
+    route_with_rules,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -48,6 +56,36 @@ class BatchItem:
     day: Optional[date] = None
 
 
+# Decimal constants: parsed once, not per entry. The scales mirror the
+# Numeric columns, so in-session objects already hold what the DB stores.
+_ZERO_AMOUNT = Decimal("0.00")
+_ZERO_VALUE = Decimal("0.0000")
+_AMOUNT_SCALE = Decimal("0.01")    # transactions.amount  Numeric(18, 2)
+_VALUE_SCALE = Decimal("0.0001")   # metrics_daily.value  Numeric(18, 4)
+
+# Enum columns store raw values (see enum_values), so resolve them once.
+_TX_INCOME = TransactionType.income.value
+_TX_TRANSFER = TransactionType.transfer.value
+_TX_EXPENSE = TransactionType.expense.value
+_TASK_PENDING = TaskStatus.pending.value
+_PROJECT_ACTIVE = ProjectStatus.active.value
+
+
+# ---------------------------------------------------------------------------
+# Pattern constants
+# ---------------------------------------------------------------------------
+
+_AMOUNT_RE = re.compile(r"[\$€]?\s*(\d[\d,\.]*)")
+_INCOME_RE = re.compile(r"(ingreso|income|cobr|recibi|recib[íi])", re.IGNORECASE)
+_TRANSFER_RE = re.compile(r"(transfer|envié|envi[eé])", re.IGNORECASE)
+_TASK_PREFIX_RE = re.compile(r"^(TODO|TASK|tarea|hacer)\s*[:\-]?\s*", re.IGNORECASE)
+_PROJECT_PREFIX_RE = re.compile(r"^(PROJECT|PROYECTO)\s*[:\-]?\s*", re.IGNORECASE)
+_METRIC_RE = re.compile(
+    r"(?:METRIC|METRICA|KPI)\s*:\s*(\w[\w\s]*?)\s*=\s*([\d\.]+)\s*(\w+)?",
+    re.IGNORECASE,
+)
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -56,24 +94,32 @@ def _today() -> date:
     return datetime.now(tz=timezone.utc).date()
 
 
+def _strip_prefix(pattern: re.Pattern[str], text: str) -> str:
+    """Drop an anchored prefix match (if any) and surrounding whitespace."""
+    m = pattern.match(text)
+    return (text[m.end():] if m else text).strip()
+
+
 def _extract_amount(text: str) -> Optional[Decimal]:
-    """Extract the first numeric amount from free text."""
-    match = re.search(r"[\$€]?\s*(\d[\d,\.]*)", text)
+    """
+    Extract the first numeric amount from free text, at the column's scale.
+    None if there is none or it can't be represented (too many digits).
+    """
+    match = _AMOUNT_RE.search(text)
     if match:
         try:
-            return Decimal(match.group(1).replace(",", ""))
+            return Decimal(match.group(1).replace(",", "")).quantize(_AMOUNT_SCALE)
         except InvalidOperation:
             pass
     return None
 
 
 def _detect_tx_type(text: str) -> str:
-    lower = text.lower()
-    if re.search(r"(ingreso|income|cobr|recibi|recib[íi])", lower):
-        return TransactionType.income
-    if re.search(r"(transfer|envié|envi[eé])", lower):
-        return TransactionType.transfer
-    return TransactionType.expense
+    if _INCOME_RE.search(text):
+        return _TX_INCOME
+    if _TRANSFER_RE.search(text):
+        return _TX_TRANSFER
+    return _TX_EXPENSE
 
 
 # ---------------------------------------------------------------------------
@@ -85,13 +131,14 @@ def _ingest_one(
     db: Session,
     source: Optional[str],
     day: Optional[date],
+    default_day: date,
 ) -> IngestResult:
     """
-    Route → persist entry → fan-out.
+    Route → persist entry → fan-out. `default_day` applies when `day` is None.
     Calls db.flush() to obtain entry.id but does NOT commit.
     The caller is responsible for commit / rollback.
     """
-    target_day = day or _today()
+    target_day = day or default_day
     result: RoutingResult = route_entry(raw, db)
 
     entry = Entry(
@@ -105,12 +152,76 @@ def _ingest_one(
     db.add(entry)
     db.flush()  # get entry.id before fan-out
 
+    # The domain row is flushed by the caller's savepoint release / commit.
     domain_entity = _fan_out(entry, result, target_day, db)
-    db.flush()
 
     return IngestResult(entry=entry, domain_entity=domain_entity)
 
 
+_DomainRow = tuple[type, dict[str, Any]]
+
+
+def _task_row(raw: str, result: RoutingResult, day: date) -> _DomainRow:
+    title = _strip_prefix(_TASK_PREFIX_RE, raw)
+    return Task, {"title": title or raw, "status": _TASK_PENDING, "day": day}
+
+
+def _transaction_row(raw: str, result: RoutingResult, day: date) -> _DomainRow:
+    return Transaction, {
+        "amount": _extract_amount(raw) or _ZERO_AMOUNT,
+        "currency": "USD",
+        "tx_type": _detect_tx_type(raw),
+        "description": raw,
+        "day": day,
+    }
+
+
+def _fact_row(raw: str, result: RoutingResult, day: date) -> _DomainRow:
+    return Fact, {"content": raw, "category": result.entry_type, "day": day}
+
+
+def _metric_row(raw: str, result: RoutingResult, day: date) -> _DomainRow:
+    name, value, unit = "unknown", _ZERO_VALUE, None
+    m = _METRIC_RE.search(raw)
+    if m:
+        name = m.group(1).strip()
+        try:
+            value = Decimal(m.group(2)).quantize(_VALUE_SCALE)
+        except InvalidOperation:
+            pass
+        unit = m.group(3)
+    return MetricDaily, {"name": name, "value": value, "unit": unit, "day": day}
+
+
+def _project_row(raw: str, result: RoutingResult, day: date) -> _DomainRow:
+    proj_name = _strip_prefix(_PROJECT_PREFIX_RE, raw)
+    # projects has no entry_id column
+    return Project, {"name": proj_name or raw, "status": _PROJECT_ACTIVE}
+
+
+# Routing target → row builder; one dict lookup instead of a string compare chain.
+_DOMAIN_ROWS: dict[str, Callable[[str, RoutingResult, date], _DomainRow]] = {
+    "tasks": _task_row,
+    "transactions": _transaction_row,
+    "facts": _fact_row,
+    "metrics_daily": _metric_row,
+    "projects": _project_row,
+}
+
+
+def _domain_row(
+    raw: str,
+    result: RoutingResult,
+    day: date,
+) -> Optional[_DomainRow]:
+    """
+    Pure: (model, column values) of the domain record for the routed target,
+    without entry_id. None when the target has no domain table.
+    """
+    builder = _DOMAIN_ROWS.get(result.target)
+    return builder(raw, result, day) if builder is not None else None
+
+
 def _fan_out(
     entry: Entry,
     result: RoutingResult,
@@ -118,71 +229,15 @@ def _fan_out(
     db: Session,
 ) -> Any:
     """Create the domain record corresponding to the routed target."""
-    target = result.target
-
-    if target == "tasks":
-        title = re.sub(
-            r"^(TODO|TASK|tarea|hacer)\s*[:\-]?\s*", "", entry.raw, flags=re.IGNORECASE
-        ).strip()
-        obj = Task(
-            entry_id=entry.id,
-            title=title or entry.raw,
-            status=TaskStatus.pending,
-            day=day,
-        )
-        db.add(obj)
-        return obj
-
-    if target == "transactions":
-        amount = _extract_amount(entry.raw) or Decimal("0.00")
-        obj = Transaction(
-            entry_id=entry.id,
-            amount=amount,
-            currency="USD",
-            tx_type=_detect_tx_type(entry.raw),
-            description=entry.raw,
-            day=day,
-        )
-        db.add(obj)
-        return obj
-
-    if target == "facts":
-        obj = Fact(
-            entry_id=entry.id,
-            content=entry.raw,
-            category=result.entry_type,
-            day=day,
-        )
-        db.add(obj)
-        return obj
-
-    if target == "metrics_daily":
-        name, value, unit = "unknown", Decimal("0"), None
-        m = re.search(
-            r"(?:METRIC|METRICA|KPI)\s*:\s*(\w[\w\s]*?)\s*=\s*([\d\.]+)\s*(\w+)?",
-            entry.raw,
-            re.IGNORECASE,
-        )
-        if m:
-            name = m.group(1).strip()
-            try:
-                value = Decimal(m.group(2))
-            except InvalidOperation:
-                pass
-            unit = m.group(3)
-        obj = MetricDaily(entry_id=entry.id, name=name, value=value, unit=unit, day=day)
-        db.add(obj)
-        return obj
-
-    if target == "projects":
-        proj_name = re.sub(
-            r"^(PROJECT|PROYECTO)\s*[:\-]?\s*", "", entry.raw, flags=re.IGNORECASE
-        ).strip()
-        obj = Project(name=proj_name or entry.raw, status=ProjectStatus.active)
-        db.add(obj)
-        return obj
-
-    return None
+    spec = _domain_row(entry.raw, result, day)
+    if spec is None:
+        return None
+    model, values = spec
+    if model is not Project:
+        values["entry_id"] = entry.id
+    obj = model(**values)
+    db.add(obj)
+    return obj
 
 
 # ---------------------------------------------------------------------------
@@ -196,14 +251,10 @@ def ingest_raw(
     day: Optional[date] = None,
 ) -> IngestResult:
     """Route, persist, and commit a single entry. Returns IngestResult."""
-    ir = _ingest_one(raw, db, source, day)
+    ir = _ingest_one(raw, db, source, day, _today())
+    # Sessions don't expire on commit and server defaults come back via
+    # RETURNING, so the objects are complete without a refresh.
     db.commit()
-    db.refresh(ir.entry)
-    if ir.domain_entity is not None:
-        try:
-            db.refresh(ir.domain_entity)
-        except Exception:
-            pass
     return ir
 
 
@@ -213,32 +264,108 @@ def ingest_raw(
 
 def ingest_batch(items: list[BatchItem], db: Session) -> list[dict]:
     """
-    Ingest a list of items using one savepoint per item.
-    A failure on one item does not cancel the others.
+    Ingest a list of items; a failure on one item does not cancel the others.
+
+    Fast path: route every item against one rules load, then one bulk
+    INSERT ... RETURNING for entries and one per domain table, all inside a
+    savepoint. If that savepoint fails (e.g. a duplicate metric), fall back
+    to one savepoint per item so the error is pinned to the right index.
     Returns a list of raw dicts for the router to convert to BatchItemResult.
     """
+    default_day = _today()
+    loaded: list[Any] = []
+    savepoint = db.begin_nested()
+    try:
+        raw_results = _ingest_bulk(items, db, default_day, loaded)
+        savepoint.commit()
+    except Exception:
+        savepoint.rollback()
+        # RETURNING rows were put in the identity map directly, not via
+        # flush, so the rollback does not evict them; their ids are reused.
+        for obj in loaded:
+            db.expunge(obj)
+        raw_results = _ingest_each(items, db, default_day)
+
+    db.commit()
+    return raw_results
+
+
+def _ingest_bulk(
+    items: list[BatchItem],
+    db: Session,
+    default_day: date,
+    loaded: list[Any],
+) -> list[dict]:
+    """
+    All-or-nothing bulk insert of a batch. Flush only, no commit.
+    Every ORM object returned by RETURNING is appended to `loaded`.
+    """
+    rules = load_active_rules(db)
+
+    entry_rows: list[dict[str, Any]] = []
+    specs: list[Optional[tuple[type, dict[str, Any]]]] = []
+    for item in items:
+        target_day = item.day or default_day
+        result = route_with_rules(item.raw, rules)
+        entry_rows.append({
+            "raw": item.raw,
+            "entry_type": result.entry_type,
+            "source": item.source,
+            "day": target_day,
+            "routed_to": result.target,
+            "rule_matched": result.rule_name,
+        })
+        specs.append(_domain_row(item.raw, result, target_day))
+
+    entries = db.scalars(
+        insert(Entry).returning(Entry, sort_by_parameter_order=True), entry_rows
+    ).all()
+    loaded.extend(entries)
+
+    # Bucket domain rows per table, remembering which item each row belongs to.
+    buckets: dict[type, tuple[list[int], list[dict[str, Any]]]] = {}
+    for i, spec in enumerate(specs):
+        if spec is None:
+            continue
+        model, values = spec
+        if model is not Project:
+            values["entry_id"] = entries[i].id
+        indices, rows = buckets.setdefault(model, ([], []))
+        indices.append(i)
+        rows.append(values)
+
+    domain: list[Any] = [None] * len(items)
+    for model, (indices, rows) in buckets.items():
+        objs = db.scalars(
+            insert(model).returning(model, sort_by_parameter_order=True), rows
+        ).all()
+        loaded.extend(objs)
+        for i, obj in zip(indices, objs):
+            domain[i] = obj
+
+    return [
+        {
+            "index": i,
+            "ok": True,
+            "result": IngestResult(entry=entry, domain_entity=domain[i]),
+            "error": None,
+        }
+        for i, entry in enumerate(entries)
+    ]
+
+
+def _ingest_each(items: list[BatchItem], db: Session, default_day: date) -> list[dict]:
+    """One savepoint per item. Flush only, no commit."""
     raw_results = []
 
     for i, item in enumerate(items):
         savepoint = db.begin_nested()
         try:
-            ir = _ingest_one(item.raw, db, item.source, item.day)
+            ir = _ingest_one(item.raw, db, item.source, item.day, default_day)
             savepoint.commit()
             raw_results.append({"index": i, "ok": True, "result": ir, "error": None})
         except Exception as exc:
             savepoint.rollback()
             raw_results.append({"index": i, "ok": False, "result": None, "error": str(exc)})
 
-    db.commit()
-
-    # Refresh successfully persisted entities after the outer commit
-    for r in raw_results:
-        if r["ok"] and r["result"] is not None:
-            try:
-                db.refresh(r["result"].entry)
-                if r["result"].domain_entity is not None:
-                    db.refresh(r["result"].domain_entity)
-            except Exception:
-                pass
-
     return raw_results
@@ -13,18 +13,22 @@ Public API
 compile_day_memory(db, day)                     -> NarrativeMemory  (upsert)
 compile_week_memory(db, week_start)             -> NarrativeMemory  (upsert)
 get_snapshots(db, snapshot_type, limit, offset) -> tuple[int, list[NarrativeMemory]]
+split_tags(text)                                -> list[str]
 """
 from __future__ import annotations
 
-import json
+import heapq
 import re
 from collections import Counter
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Optional
+from operator import attrgetter
+from typing import Any, Iterable, Optional
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.db.upsert import upsert
 from app.models.entry import Entry
 from app.models.task import Task
 from app.models.transaction import Transaction
@@ -41,23 +45,49 @@ def _today() -> date:
     return datetime.now(tz=timezone.utc).date()
 
 
-def _ev(v) -> str:
+def _ev(v, _value=attrgetter("value")) -> str:
     """Return bare string value from a str-enum or plain str."""
-    return v.value if hasattr(v, "value") else str(v)
+    return v if v.__class__ is str else _value(v)
 
 
-def _jdump(items: list[str]) -> str:
-    return json.dumps(items, ensure_ascii=False)
+# Tags are single tokens (entry types + fixed labels), so dropping every
+# whitespace char is equivalent to stripping each one.
+_TAG_STRIP = str.maketrans("", "", " \t\n\r")
 
 
-def _jload(text: Optional[str]) -> list[str]:
+def split_tags(text: Optional[str]) -> list[str]:
+    """Comma-separated tags column → list of unique non-empty tags, in order."""
     if not text:
         return []
-    try:
-        result = json.loads(text)
-        return result if isinstance(result, list) else []
-    except (ValueError, TypeError):
-        return []
+    return list(dict.fromkeys(t for t in text.translate(_TAG_STRIP).split(",") if t))
+
+
+def _project_name(raw: str) -> str:
+    """Project name from a PROJECT:/PROYECTO: entry (raw text if nothing left)."""
+    m = _PROJECT_PREFIX_RE.match(raw)
+    return (raw[m.end():] if m else raw).strip() or raw
+
+
+def _dedup_cap(items: Iterable[str], cap: int) -> list[str]:
+    """First `cap` distinct items, in order; stops reading once full."""
+    seen: set[str] = set()
+    out: list[str] = []
+    for item in items:
+        if item in seen:
+            continue
+        seen.add(item)
+        out.append(item)
+        if len(out) == cap:
+            break
+    return out
+
+
+def _as_list(value: Any) -> list[str]:
+    """JSON list column value → list; None or anything else → []."""
+    return value if isinstance(value, list) else []
+
+
+_ZERO = Decimal("0")
 
 
 # ---------------------------------------------------------------------------
@@ -108,9 +138,9 @@ def _infer_emotional_state(
             labels.append("backlogged")
 
     # Cashflow
-    if net_cashflow > Decimal("0"):
+    if net_cashflow > _ZERO:
         labels.append("financially_positive")
-    elif net_cashflow < Decimal("0"):
+    elif net_cashflow < _ZERO:
         labels.append("financially_cautious")
 
     # Knowledge capture
@@ -125,28 +155,29 @@ def _infer_emotional_state(
 
 
 def _extract_key_events(
-    tasks: list[Task],
+    done_tasks: list[Task],
     transactions: list[Transaction],
     project_entries: list[Entry],
     metrics: list[MetricDaily],
 ) -> list[str]:
     """
     Extract the most notable events from a day, capped at 10 items.
+    done_tasks: tasks whose status is done.
     project_entries: entries with routed_to == 'projects'.
     """
     events: list[str] = []
 
     # Completed tasks (up to 3)
-    for t in [t for t in tasks if _ev(t.status) == "done"][:3]:
+    for t in done_tasks[:3]:
         events.append(f"Task completed: {t.title}")
 
     # New projects (up to 2, extract name from raw entry)
     for e in project_entries[:2]:
-        proj_name = _PROJECT_PREFIX_RE.sub("", e.raw).strip()
-        events.append(f"Project created: {proj_name or e.raw}")
+        events.append(f"Project created: {_project_name(e.raw)}")
 
     # Largest transactions by abs(amount), up to 3
-    for tx in sorted(transactions, key=lambda t: abs(t.amount), reverse=True)[:3]:
+    # nlargest == sorted(..., reverse=True)[:3], without sorting the whole day.
+    for tx in heapq.nlargest(3, transactions, key=lambda t: abs(t.amount)):
         kind = _ev(tx.tx_type)
         desc = tx.description or "—"
         events.append(f"Transaction ({kind}): {tx.currency} {tx.amount} — {desc}")
@@ -170,7 +201,7 @@ def _extract_decisions(entries: list[Entry], tasks: list[Task]) -> list[str]:
     for t in tasks:
         if _DECISION_RE.search(t.title):
             decisions.append(f"Task: {t.title[:200]}")
-    return list(dict.fromkeys(decisions))[:10]
+    return _dedup_cap(decisions, 10)
 
 
 def _extract_lessons(facts: list[Fact], entries: list[Entry]) -> list[str]:
@@ -236,17 +267,19 @@ def _build_day_fields(
     """
     total_entries = len(entries)
 
-    tasks_done = sum(1 for t in tasks if _ev(t.status) == "done")
+    # Status / type strings resolved once per row and reused below.
+    done_tasks = [t for t in tasks if _ev(t.status) == "done"]
+    tasks_done = len(done_tasks)
     tasks_total = len(tasks)
 
-    income = sum(
-        (t.amount for t in transactions if _ev(t.tx_type) == "income"),
-        Decimal("0"),
-    )
-    expense = sum(
-        (t.amount for t in transactions if _ev(t.tx_type) == "expense"),
-        Decimal("0"),
-    )
+    # One pass over transactions for both totals (exact Decimal arithmetic).
+    income = expense = _ZERO
+    for t in transactions:
+        kind = _ev(t.tx_type)
+        if kind == "income":
+            income += t.amount
+        elif kind == "expense":
+            expense += t.amount
     net = income - expense
 
     project_entries = [e for e in entries if e.routed_to == "projects"]
@@ -265,22 +298,19 @@ def _build_day_fields(
     if metrics:
         parts.append(f"{len(metrics)} metric(s) tracked.")
     if project_entries:
-        names = ", ".join(
-            _PROJECT_PREFIX_RE.sub("", e.raw).strip() or e.raw
-            for e in project_entries[:3]
-        )
+        names = ", ".join(_project_name(e.raw) for e in project_entries[:3])
         parts.append(f"Projects: {names}.")
     summary = " ".join(parts)
 
-    key_events = _extract_key_events(tasks, transactions, project_entries, metrics)
+    key_events = _extract_key_events(done_tasks, transactions, project_entries, metrics)
     decisions = _extract_decisions(entries, tasks)
     lessons = _extract_lessons(facts, entries)
 
     entry_types = {_ev(e.entry_type) for e in entries}
     tags = _infer_tags(
         entry_types=entry_types,
-        has_income=income > Decimal("0"),
-        has_expense=expense > Decimal("0"),
+        has_income=income > _ZERO,
+        has_expense=expense > _ZERO,
         has_projects=bool(project_entries),
         has_metrics=bool(metrics),
     )
@@ -295,10 +325,10 @@ def _build_day_fields(
 
     return {
         "summary": summary,
-        "key_events": _jdump(key_events),
+        "key_events": key_events,
         "emotional_state": emotional_state,
-        "decisions_made": _jdump(decisions),
-        "lessons": _jdump(lessons),
+        "decisions_made": decisions,
+        "lessons": lessons,
         "tags": ",".join(tags),
     }
 
@@ -309,31 +339,14 @@ def _upsert_snapshot(
     snapshot_type: str,
     fields: dict,
 ) -> NarrativeMemory:
-    """Insert or update a NarrativeMemory row for (date, snapshot_type)."""
-    existing = (
-        db.query(NarrativeMemory)
-        .filter(
-            NarrativeMemory.date == target_date,
-            NarrativeMemory.snapshot_type == snapshot_type,
-        )
-        .first()
-    )
-    if existing is not None:
-        for key, value in fields.items():
-            setattr(existing, key, value)
-        db.flush()
-        db.commit()
-        db.refresh(existing)
-        return existing
-
-    snapshot = NarrativeMemory(
-        date=target_date,
-        snapshot_type=snapshot_type,
-        **fields,
+    """Insert or update the NarrativeMemory row for (date, snapshot_type)."""
+    snapshot = upsert(
+        db,
+        NarrativeMemory,
+        {"date": target_date, "snapshot_type": snapshot_type, **fields},
+        conflict_columns=("date", "snapshot_type"),
     )
-    db.add(snapshot)
     db.commit()
-    db.refresh(snapshot)
     return snapshot
 
 
@@ -341,6 +354,39 @@ def _upsert_snapshot(
 # Public — compile single day
 # ---------------------------------------------------------------------------
 
+# Only the columns the narrative builders read. Rows come back as plain
+# Row tuples (attribute access works the same), so nothing is hydrated into
+# ORM objects or tracked by the session.
+_SOURCE_COLUMNS = {
+    Entry: (Entry.raw, Entry.entry_type, Entry.routed_to),
+    Task: (Task.title, Task.status),
+    Transaction: (Transaction.amount, Transaction.currency, Transaction.tx_type,
+                  Transaction.description),
+    Fact: (Fact.content,),
+    MetricDaily: (MetricDaily.name, MetricDaily.value, MetricDaily.unit),
+}
+
+
+def _by_day(db: Session, model, days: list[date]) -> dict[date, list]:
+    """Source rows of `model` whose day is in `days`, grouped by day."""
+    grouped: dict[date, list] = {d: [] for d in days}
+    stmt = select(model.day, *_SOURCE_COLUMNS[model]).where(model.day.in_(days))
+    for row in db.execute(stmt):
+        grouped[row.day].append(row)
+    return grouped
+
+
+def _day_sources(db: Session, days: list[date]) -> dict[str, dict[date, list]]:
+    """Everything _build_day_fields needs for `days`: one query per table."""
+    return {
+        "entries": _by_day(db, Entry, days),
+        "tasks": _by_day(db, Task, days),
+        "transactions": _by_day(db, Transaction, days),
+        "facts": _by_day(db, Fact, days),
+        "metrics": _by_day(db, MetricDaily, days),
+    }
+
+
 def compile_day_memory(
     db: Session,
     day: Optional[date] = None,
@@ -352,24 +398,30 @@ def compile_day_memory(
     Event store (entries) is the source of truth — all data is read from it.
     """
     target = day or _today()
-
-    entries = db.query(Entry).filter(Entry.day == target).all()
-    tasks = db.query(Task).filter(Task.day == target).all()
-    transactions = db.query(Transaction).filter(Transaction.day == target).all()
-    facts = db.query(Fact).filter(Fact.day == target).all()
-    metrics = db.query(MetricDaily).filter(MetricDaily.day == target).all()
-
+    sources = _day_sources(db, [target])
     fields = _build_day_fields(
-        day=target,
-        entries=entries,
-        tasks=tasks,
-        transactions=transactions,
-        facts=facts,
-        metrics=metrics,
+        day=target, **{name: rows[target] for name, rows in sources.items()}
     )
     return _upsert_snapshot(db, target, "daily", fields)
 
 
+def _compile_days(db: Session, days: list[date]) -> dict[date, NarrativeMemory]:
+    """
+    Build and add (uncommitted) daily snapshots for days that have none.
+    One IN query per source table instead of five queries per day.
+    """
+    sources = _day_sources(db, days)
+
+    snapshots: dict[date, NarrativeMemory] = {}
+    for d in days:
+        fields = _build_day_fields(
+            day=d, **{name: rows[d] for name, rows in sources.items()}
+        )
+        snapshots[d] = NarrativeMemory(date=d, snapshot_type="daily", **fields)
+    db.add_all(snapshots.values())
+    return snapshots
+
+
 # ---------------------------------------------------------------------------
 # Public — compile week
 # ---------------------------------------------------------------------------
@@ -385,20 +437,21 @@ def compile_week_memory(
     """
     days = [week_start + timedelta(days=i) for i in range(7)]
 
-    # Guarantee all daily snapshots exist
-    daily_snapshots: list[NarrativeMemory] = []
-    for d in days:
-        snap = (
-            db.query(NarrativeMemory)
-            .filter(
-                NarrativeMemory.date == d,
+    # Guarantee all daily snapshots exist: one IN query for the ones already
+    # compiled, one batch build for the rest (persisted with the weekly commit).
+    existing = {
+        snap.date: snap
+        for snap in db.scalars(
+            select(NarrativeMemory).where(
+                NarrativeMemory.date.in_(days),
                 NarrativeMemory.snapshot_type == "daily",
             )
-            .first()
         )
-        if snap is None:
-            snap = compile_day_memory(db, d)
-        daily_snapshots.append(snap)
+    }
+    missing = [d for d in days if d not in existing]
+    if missing:
+        existing.update(_compile_days(db, missing))
+    daily_snapshots = [existing[d] for d in days]
 
     # Aggregate across days
     all_key_events: list[str] = []
@@ -409,20 +462,19 @@ def compile_week_memory(
     active_days = 0
 
     for snap in daily_snapshots:
-        all_key_events.extend(_jload(snap.key_events))
-        all_decisions.extend(_jload(snap.decisions_made))
-        all_lessons.extend(_jload(snap.lessons))
-        if snap.tags:
-            all_tags.update(t.strip() for t in snap.tags.split(",") if t.strip())
+        all_key_events.extend(_as_list(snap.key_events))
+        all_decisions.extend(_as_list(snap.decisions_made))
+        all_lessons.extend(_as_list(snap.lessons))
+        all_tags.update(split_tags(snap.tags))
         if snap.emotional_state:
             all_state_labels.extend(snap.emotional_state.split("+"))
         if "No entries recorded" not in snap.summary:
             active_days += 1
 
     # Deduplicate, cap
-    key_events = list(dict.fromkeys(all_key_events))[:15]
-    decisions = list(dict.fromkeys(all_decisions))[:10]
-    lessons = list(dict.fromkeys(all_lessons))[:10]
+    key_events = _dedup_cap(all_key_events, 15)
+    decisions = _dedup_cap(all_decisions, 10)
+    lessons = _dedup_cap(all_lessons, 10)
     tags = sorted(all_tags)
 
     # Dominant state labels for the week
@@ -447,10 +499,10 @@ def compile_week_memory(
 
     fields = {
         "summary": " ".join(summary_parts),
-        "key_events": _jdump(key_events),
+        "key_events": key_events,
         "emotional_state": weekly_state,
-        "decisions_made": _jdump(decisions),
-        "lessons": _jdump(lessons),
+        "decisions_made": decisions,
+        "lessons": lessons,
         "tags": ",".join(tags),
     }
     return _upsert_snapshot(db, week_start, "weekly", fields)
@@ -466,10 +518,27 @@ def get_snapshots(
     limit: int = 20,
     offset: int = 0,
 ) -> tuple[int, list[NarrativeMemory]]:
-    """Return (total_count, page) ordered by date descending."""
-    q = db.query(NarrativeMemory)
+    """
+    Return (total_count, page) ordered by date descending.
+
+    One round trip: the total rides along each row as COUNT(*) OVER ().
+    Only a page past the end (no rows to carry it) needs a separate count.
+    """
+    where = []
     if snapshot_type:
-        q = q.filter(NarrativeMemory.snapshot_type == snapshot_type)
-    total = q.count()
-    items = q.order_by(NarrativeMemory.date.desc()).offset(offset).limit(limit).all()
-    return total, items
+        where.append(NarrativeMemory.snapshot_type == snapshot_type)
+
+    stmt = (
+        select(NarrativeMemory, func.count().over().label("total"))
+        .where(*where)
+        .order_by(NarrativeMemory.date.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    rows = db.execute(stmt).all()
+    if rows:
+        return rows[0].total, [row.NarrativeMemory for row in rows]
+    if offset == 0:
+        return 0, []
+    total = db.scalar(select(func.count(NarrativeMemory.id)).where(*where)) or 0
+    return total, []
@@ -24,11 +24,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal, ROUND_HALF_UP
+from operator import attrgetter
 from typing import Optional
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, literal, select, union_all
 
+from app.db.upsert import upsert
 from app.models.entry import Entry
 from app.models.task import Task, TaskStatus
 from app.models.transaction import Transaction
@@ -64,68 +66,81 @@ class WeeklyClarity:
 # ---------------------------------------------------------------------------
 
 MIN_EVENTS = 3
+_SCORE_QUANTUM = Decimal("0.0001")
 
 
 def _today() -> date:
     return datetime.now(tz=timezone.utc).date()
 
 
-def _ev(v) -> str:
-    return v.value if hasattr(v, "value") else str(v)
+def _ev(v, _value=attrgetter("value")) -> str:
+    return v if v.__class__ is str else _value(v)
 
 
 # ---------------------------------------------------------------------------
-# Core — single day check (pure query, no writes)
+# Core — per-day checks (pure query, no writes)
 # ---------------------------------------------------------------------------
 
-def _check_day(db: Session, day: date) -> DailyClarity:
+def _day_counts(db: Session, start: date, end: date) -> dict[str, dict[date, int]]:
     """
-    Evaluate whether a single day meets the Complete Day criteria.
-    Reads only from: entries, tasks, transactions, narrative_memory.
+    Per-day counts for every criterion over [start, end], in one round trip.
+    Each source is aggregated on its own (joining them would multiply rows),
+    then the grouped selects are combined with UNION ALL.
+    Returns {"events"|"tasks_done"|"transactions"|"snapshots": {day: count}}.
     """
-    # Criterion 1: at least MIN_EVENTS entries
-    event_count: int = (
-        db.query(func.count(Entry.id))
-        .filter(Entry.day == day)
-        .scalar()
-        or 0
-    )
-
-    # Criterion 2: at least 1 task done OR 1 transaction
-    task_done: int = (
-        db.query(func.count(Task.id))
-        .filter(Task.day == day, Task.status == TaskStatus.done)
-        .scalar()
-        or 0
-    )
-    tx_count: int = (
-        db.query(func.count(Transaction.id))
-        .filter(Transaction.day == day)
-        .scalar()
-        or 0
-    )
-    has_outcome = (task_done > 0) or (tx_count > 0)
-
-    # Criterion 3: daily narrative memory snapshot exists
-    has_memory_snapshot: bool = (
-        db.query(NarrativeMemory.id)
-        .filter(
-            NarrativeMemory.date == day,
-            NarrativeMemory.snapshot_type == "daily",
+    def grouped(kind: str, day_col, *criteria):
+        return (
+            select(literal(kind).label("kind"), day_col.label("day"), func.count().label("n"))
+            .where(day_col.between(start, end), *criteria)
+            .group_by(day_col)
         )
-        .first()
-        is not None
+
+    stmt = union_all(
+        grouped("events", Entry.day),
+        grouped("tasks_done", Task.day, Task.status == TaskStatus.done),
+        grouped("transactions", Transaction.day),
+        grouped("snapshots", NarrativeMemory.date, NarrativeMemory.snapshot_type == "daily"),
     )
+    counts: dict[str, dict[date, int]] = {
+        "events": {}, "tasks_done": {}, "transactions": {}, "snapshots": {},
+    }
+    for kind, day, n in db.execute(stmt):
+        counts[kind][day] = n
+    return counts
 
-    is_complete = (event_count >= MIN_EVENTS) and has_outcome and has_memory_snapshot
 
-    return DailyClarity(
-        day=day,
-        is_complete=is_complete,
-        event_count=event_count,
-        has_outcome=has_outcome,
-        has_memory_snapshot=has_memory_snapshot,
-    )
+def _check_days(db: Session, days: list[date]) -> list[DailyClarity]:
+    """
+    Evaluate the Complete Day criteria for each day in `days` (contiguous,
+    oldest first). Reads only from: entries, tasks, transactions,
+    narrative_memory.
+    """
+    counts = _day_counts(db, days[0], days[-1])
+    events = counts["events"]
+    tasks_done = counts["tasks_done"]
+    transactions = counts["transactions"]
+    snapshots = counts["snapshots"]
+
+    results = []
+    for day in days:
+        event_count = events.get(day, 0)
+        # Criterion 2: at least 1 task done OR 1 transaction
+        has_outcome = tasks_done.get(day, 0) > 0 or transactions.get(day, 0) > 0
+        # Criterion 3: daily narrative memory snapshot exists
+        has_memory_snapshot = day in snapshots
+        results.append(DailyClarity(
+            day=day,
+            is_complete=(event_count >= MIN_EVENTS) and has_outcome and has_memory_snapshot,
+            event_count=event_count,
+            has_outcome=has_outcome,
+            has_memory_snapshot=has_memory_snapshot,
+        ))
+    return results
+
+
+def _check_day(db: Session, day: date) -> DailyClarity:
+    """Evaluate whether a single day meets the Complete Day criteria."""
+    return _check_days(db, [day])[0]
 
 
 # ---------------------------------------------------------------------------
@@ -152,12 +167,12 @@ def calculate_weekly_clarity(
     end = reference_date or _today()
     days = [end - timedelta(days=i) for i in range(6, -1, -1)]  # oldest → newest
 
-    daily_results = [_check_day(db, d) for d in days]
+    daily_results = _check_days(db, days)
     complete = sum(1 for r in daily_results if r.is_complete)
     total = len(days)
 
     raw_score = Decimal(complete) / Decimal(total)
-    score = raw_score.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+    score = raw_score.quantize(_SCORE_QUANTUM, rounding=ROUND_HALF_UP)
 
     return WeeklyClarity(
         reference_date=end,
@@ -188,24 +203,16 @@ def get_north_star(
 
 def _upsert_snapshot(db: Session, result: WeeklyClarity) -> None:
     """Persist or refresh a weekly north_star_snapshots row."""
-    existing = (
-        db.query(NorthStarSnapshot)
-        .filter(
-            NorthStarSnapshot.period_type == "weekly",
-            NorthStarSnapshot.reference_date == result.reference_date,
-        )
-        .first()
+    upsert(
+        db,
+        NorthStarSnapshot,
+        {
+            "period_type": "weekly",
+            "reference_date": result.reference_date,
+            "clarity_score": result.clarity_score,
+            "complete_days": result.complete_days,
+            "total_days": result.total_days,
+        },
+        conflict_columns=("period_type", "reference_date"),
     )
-    if existing is not None:
-        existing.clarity_score = result.clarity_score
-        existing.complete_days = result.complete_days
-        existing.total_days = result.total_days
-    else:
-        db.add(NorthStarSnapshot(
-            period_type="weekly",
-            reference_date=result.reference_date,
-            clarity_score=result.clarity_score,
-            complete_days=result.complete_days,
-            total_days=result.total_days,
-        ))
     db.commit()
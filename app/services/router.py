@@ -8,9 +8,12 @@ Falls back to "note" / "facts" if no rule matches.
 from __future__ import annotations
 
 import re
+import time
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional, Union
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.rule import RuleRouter
@@ -23,46 +26,93 @@ class RoutingResult:
     rule_name: Optional[str]
 
 
-def route_entry(raw: str, db: Session) -> RoutingResult:
+@dataclass(frozen=True)
+class ActiveRule:
+    """Detached snapshot of one active rules_router row (safe to share)."""
+    name: str
+    pattern: str
+    target: str
+    entry_type: str
+
+
+# Rules change rarely (seed scripts, migrations), so the active list is
+# cached per process. Code that writes rules_router calls
+# invalidate_rules_cache() once its transaction has committed or rolled back;
+# the TTL bounds staleness for edits made by other processes.
+_RULES_TTL_SECONDS = 30.0
+_rules_cache: Optional[tuple[float, list[ActiveRule]]] = None
+
+_ACTIVE_RULES = (
+    select(RuleRouter.name, RuleRouter.pattern, RuleRouter.target, RuleRouter.entry_type)
+    .where(RuleRouter.is_active == True)  # noqa: E712
+    .order_by(RuleRouter.priority.desc())
+)
+
+
+def invalidate_rules_cache() -> None:
     """
-    Evaluate active rules in priority order against `raw`.
-    Returns the first matching rule's routing info.
+    Force the next load_active_rules() call to re-read rules_router.
+    Call after committing (or rolling back) any rules_router write.
     """
-    rules: list[RuleRouter] = (
-        db.query(RuleRouter)
-        .filter(RuleRouter.is_active == True)  # noqa: E712
-        .order_by(RuleRouter.priority.desc())
-        .all()
-    )
+    global _rules_cache
+    _rules_cache = None
 
-    for rule in rules:
-        try:
-            if re.search(rule.pattern, raw, re.IGNORECASE):
-                return RoutingResult(
-                    entry_type=rule.entry_type,
-                    target=rule.target,
-                    rule_name=rule.name,
-                )
-        except re.error:
-            # Bad regex pattern — skip rule
-            continue
 
+def load_active_rules(db: Session) -> list[ActiveRule]:
+    """Active rules ordered by priority DESC — load once, route many."""
+    global _rules_cache
+    now = time.monotonic()
+    cached = _rules_cache
+    if cached is not None and now - cached[0] < _RULES_TTL_SECONDS:
+        return cached[1]
+    # Column tuples, not ORM entities: nothing to hydrate or track.
+    rules = [ActiveRule(*row) for row in db.execute(_ACTIVE_RULES)]
+    _rules_cache = (now, rules)
+    return rules
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> Optional[re.Pattern[str]]:
+    """
+    Compiled, case-insensitive rule pattern; None if the regex is invalid.
+    Keyed by the pattern text, so an edited rule simply compiles anew and a
+    bad pattern is rejected once rather than on every entry.
+    """
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def route_with_rules(
+    raw: str, rules: Iterable[Union[ActiveRule, RuleRouter]]
+) -> RoutingResult:
+    """
+    Routing info of the first rule in `rules` whose pattern matches `raw`.
+    `rules` must already be active-only and priority-ordered, as returned
+    by load_active_rules().
+    """
+    for rule in rules:
+        compiled = _compile(rule.pattern)
+        if compiled is not None and compiled.search(raw):
+            return RoutingResult(
+                entry_type=rule.entry_type,
+                target=rule.target,
+                rule_name=rule.name,
+            )
     # Absolute fallback (should not happen if default_note rule exists)
     return RoutingResult(entry_type="note", target="facts", rule_name=None)
 
 
+def route_entry(raw: str, db: Session) -> RoutingResult:
+    """
+    Evaluate active rules in priority order against `raw`.
+    Returns the first matching rule's routing info; bad patterns are skipped.
+    """
+    return route_with_rules(raw, load_active_rules(db))
+
+
 def route_entry_from_rules(raw: str, rules: list[RuleRouter]) -> RoutingResult:
     """Pure version that accepts pre-loaded rules (useful for testing)."""
-    for rule in sorted(rules, key=lambda r: r.priority, reverse=True):
-        if not rule.is_active:
-            continue
-        try:
-            if re.search(rule.pattern, raw, re.IGNORECASE):
-                return RoutingResult(
-                    entry_type=rule.entry_type,
-                    target=rule.target,
-                    rule_name=rule.name,
-                )
-        except re.error:
-            continue
-    return RoutingResult(entry_type="note", target="facts", rule_name=None)
+    active = (rule for rule in rules if rule.is_active)
+    return route_with_rules(raw, sorted(active, key=lambda r: r.priority, reverse=True))
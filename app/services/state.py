@@ -7,7 +7,7 @@ from datetime import date, datetime, timezone
 from typing import Optional
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, select
 
 from app.models.entry import Entry
 from app.models.task import Task, TaskStatus
@@ -19,10 +19,19 @@ from app.models.daily_log import DailyLog
 from app.models.memory import MemorySnapshot
 
 
+# Built once; SQLAlchemy's compiled cache keys on the statement object.
+_DAILY_LOG_BY_DAY = select(DailyLog).where(DailyLog.day == bindparam("day"))
+
+
 def _today() -> date:
     return datetime.now(tz=timezone.utc).date()
 
 
+def get_daily_log(db: Session, day: Optional[date] = None) -> Optional[DailyLog]:
+    """The daily_logs row for `day` (default: today UTC), or None."""
+    return db.execute(_DAILY_LOG_BY_DAY, {"day": day or _today()}).scalar_one_or_none()
+
+
 def get_state_today(db: Session, day: Optional[date] = None):
     target = day or _today()
     entries = db.query(Entry).filter(Entry.day == target).all()
@@ -30,9 +39,9 @@ def get_state_today(db: Session, day: Optional[date] = None):
     transactions = db.query(Transaction).filter(Transaction.day == target).all()
     facts = db.query(Fact).filter(Fact.day == target).all()
     metrics = db.query(MetricDaily).filter(MetricDaily.day == target).all()
-    daily_log = db.query(DailyLog).filter(DailyLog.day == target).first()
+    daily_log = get_daily_log(db, target)
     return {
-        "day": str(target),
+        "day": target,
         "is_closed": daily_log.is_closed if daily_log else False,
         "totals": {
             "entries": len(entries),
@@ -49,26 +58,32 @@ def get_state_today(db: Session, day: Optional[date] = None):
     }
 
 
+_TASK_COLUMNS = (Task.id, Task.title, Task.status, Task.day, Task.due_date, Task.project_id)
+_PROJECT_COLUMNS = (Project.id, Project.name, Project.status, Project.start_date)
+
+
 def get_state_active(db: Session):
     """Return all active (non-closed) days with open tasks and projects."""
+    # Column rows shaped for _task_dict / _project_dict; no ORM hydration.
     open_tasks = (
-        db.query(Task)
+        db.query(*_TASK_COLUMNS)
         .filter(Task.status.in_([TaskStatus.pending, TaskStatus.in_progress]))
         .all()
     )
     active_projects = (
-        db.query(Project)
+        db.query(*_PROJECT_COLUMNS)
         .filter(Project.status == ProjectStatus.active)
         .all()
     )
-    # Days that have entries but no closed daily_log
-    closed_days = {
-        row.day
-        for row in db.query(DailyLog.day).filter(DailyLog.is_closed == True).all()  # noqa
-    }
+    # Days that have entries but no closed daily_log (set difference in SQL)
+    closed = (
+        select(DailyLog.id)
+        .where(DailyLog.day == Entry.day, DailyLog.is_closed == True)  # noqa: E712
+        .exists()
+    )
     open_days_query = (
         db.query(Entry.day, func.count(Entry.id).label("count"))
-        .filter(Entry.day.notin_(closed_days))
+        .filter(~closed)
         .group_by(Entry.day)
         .order_by(Entry.day.desc())
         .limit(30)
@@ -77,19 +92,22 @@ def get_state_active(db: Session):
     return {
         "open_tasks": [_task_dict(t) for t in open_tasks],
         "active_projects": [_project_dict(p) for p in active_projects],
-        "open_days": [{"day": str(r.day), "entries": r.count} for r in open_days_query],
+        "open_days": [{"day": r.day, "entries": r.count} for r in open_days_query],
     }
 
 
 def close_day(db: Session, day: Optional[date] = None, summary: Optional[str] = None) -> DailyLog:
     target = day or _today()
 
-    total_entries = db.query(func.count(Entry.id)).filter(Entry.day == target).scalar() or 0
-    total_tasks = db.query(func.count(Task.id)).filter(Task.day == target).scalar() or 0
-    total_transactions = db.query(func.count(Transaction.id)).filter(Transaction.day == target).scalar() or 0
-    total_facts = db.query(func.count(Fact.id)).filter(Fact.day == target).scalar() or 0
+    # All four day totals in one round trip, one scalar subquery each.
+    total_entries, total_tasks, total_transactions, total_facts = db.execute(
+        select(*(
+            select(func.count(model.id)).where(model.day == target).scalar_subquery()
+            for model in (Entry, Task, Transaction, Fact)
+        ))
+    ).one()
 
-    daily_log = db.query(DailyLog).filter(DailyLog.day == target).first()
+    daily_log = get_daily_log(db, target)
     if daily_log is None:
         daily_log = DailyLog(day=target)
         db.add(daily_log)
@@ -117,7 +135,6 @@ def close_day(db: Session, day: Optional[date] = None, summary: Optional[str] =
     )
     db.add(snapshot)
     db.commit()
-    db.refresh(daily_log)
     return daily_log
 
 
@@ -129,7 +146,7 @@ def _entry_dict(e: Entry) -> dict:
         "raw": e.raw,
         "entry_type": e.entry_type,
         "source": e.source,
-        "day": str(e.day),
+        "day": e.day,
         "routed_to": e.routed_to,
         "rule_matched": e.rule_matched,
         "created_at": e.created_at.isoformat() if e.created_at else None,
@@ -141,8 +158,8 @@ def _task_dict(t: Task) -> dict:
         "id": t.id,
         "title": t.title,
         "status": t.status,
-        "day": str(t.day),
-        "due_date": str(t.due_date) if t.due_date else None,
+        "day": t.day,
+        "due_date": t.due_date,
         "project_id": t.project_id,
     }
 
@@ -155,7 +172,7 @@ def _tx_dict(t: Transaction) -> dict:
         "tx_type": t.tx_type,
         "category": t.category,
         "description": t.description,
-        "day": str(t.day),
+        "day": t.day,
     }
 
 
@@ -164,7 +181,7 @@ def _fact_dict(f: Fact) -> dict:
         "id": f.id,
         "content": f.content,
         "category": f.category,
-        "day": str(f.day),
+        "day": f.day,
     }
 
 
@@ -174,7 +191,7 @@ def _metric_dict(m: MetricDaily) -> dict:
         "name": m.name,
         "value": str(m.value),
         "unit": m.unit,
-        "day": str(m.day),
+        "day": m.day,
     }
 
 
@@ -183,5 +200,5 @@ def _project_dict(p: Project) -> dict:
         "id": p.id,
         "name": p.name,
         "status": p.status,
-        "start_date": str(p.start_date) if p.start_date else None,
+        "start_date": p.start_date,
     }
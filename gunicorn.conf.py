@@ -4,19 +4,34 @@ Gunicorn configuration for DIOS production server.
 Tuned for Railway / Render single-instance containers.
 Env vars that override defaults:
   PORT     — TCP port to bind (Railway sets this automatically)
-  WORKERS  — number of worker processes (default: 2)
+  WORKERS      — number of worker processes (default: (2 × CPU) + 1,
+                 capped at MAX_WORKERS)
+  MAX_WORKERS  — cap on the computed default (default: 4)
 """
+import asyncio
 import os
 
 # Bind to the port Railway/Render injects via $PORT
 bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
 
-# 2 workers is safe for a 512 MB container.
-# Increase to 4 on the $10 Railway plan (1 GB RAM).
-workers = int(os.environ.get("WORKERS", "2"))
-
-# Each worker runs Uvicorn's ASGI event loop inside Gunicorn's process manager.
-worker_class = "uvicorn.workers.UvicornWorker"
+# Gunicorn's (2 × CPU) + 1 rule, capped because os.cpu_count() reports the
+# host's cores inside a container, not the plan's share. At ~80 MB per
+# worker, the default cap of 4 fits a 512 MB container; raise MAX_WORKERS
+# on larger plans. WORKERS, if set, wins outright.
+_default_workers = min(
+    max(2, 2 * (os.cpu_count() or 1) + 1),
+    int(os.environ.get("MAX_WORKERS", "4")),
+)
+workers = int(os.environ.get("WORKERS", _default_workers))
+
+# Each worker runs Uvicorn's ASGI event loop inside Gunicorn's process manager,
+# pinned to uvloop + httptools (app/core/worker.py).
+worker_class = "app.core.worker.DiosUvicornWorker"
+
+# Import the app once in the master and fork it, so workers share the loaded
+# modules copy-on-write. The engine's pool opens connections lazily, so none
+# are created before the fork.
+preload_app = True
 
 # Keep connections alive for 5 s between requests (good for mobile clients).
 keepalive = 5
@@ -32,3 +47,9 @@ access_log_format = '%(h)s "%(r)s" %(s)s %(b)sB %(D)sµs'
 
 # Graceful restart: wait up to 30 s for in-flight requests to finish.
 graceful_timeout = 30
+
+
+def post_worker_init(worker):
+    # Confirms the pinned loop at boot, e.g. "uvloop.EventLoopPolicy".
+    policy = type(asyncio.get_event_loop_policy())
+    worker.log.info("Event loop policy: %s.%s", policy.__module__, policy.__name__)
@@ -0,0 +1,39 @@
+"""behavior_events.event_metadata: Text -> JSONB
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+
+Metadata was JSON-encoded Text parsed in Python on every read; as JSONB
+the driver returns dicts directly. Existing rows are cast in place.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "behavior_events",
+        "event_metadata",
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using="event_metadata::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "behavior_events",
+        "event_metadata",
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="event_metadata::text",
+    )
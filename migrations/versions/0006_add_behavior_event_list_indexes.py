@@ -0,0 +1,35 @@
+"""add created_at DESC indexes to behavior_events
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16
+
+GET /behavior/events sorts by created_at DESC, optionally filtered by
+event_type. (event_type, created_at DESC) serves the filtered branch and
+(created_at DESC) the unfiltered one, so a page is read in index order.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_behavior_event_type_created_at",
+        "behavior_events",
+        ["event_type", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_behavior_event_created_at_desc",
+        "behavior_events",
+        [sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_behavior_event_created_at_desc", table_name="behavior_events")
+    op.drop_index("ix_behavior_event_type_created_at", table_name="behavior_events")
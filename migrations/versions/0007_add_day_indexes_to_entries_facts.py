@@ -0,0 +1,25 @@
+"""add day indexes to entries and facts
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16
+
+Daily rollups (state, memory, north star) filter entries and facts by day;
+tasks, transactions and metrics_daily already index it, these two did not.
+"""
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_entries_day", "entries", ["day"])
+    op.create_index("ix_facts_day", "facts", ["day"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_facts_day", table_name="facts")
+    op.drop_index("ix_entries_day", table_name="entries")
@@ -0,0 +1,44 @@
+"""narrative_memory list columns: Text -> JSONB
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16
+
+key_events, decisions_made and lessons held JSON-encoded Text decoded in
+Python per read; as JSONB the driver returns lists directly. Existing rows
+are cast in place.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ("key_events", "decisions_made", "lessons")
+
+
+def upgrade() -> None:
+    for column in _COLUMNS:
+        op.alter_column(
+            "narrative_memory",
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.Text(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    for column in _COLUMNS:
+        op.alter_column(
+            "narrative_memory",
+            column,
+            type_=sa.Text(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::text",
+        )
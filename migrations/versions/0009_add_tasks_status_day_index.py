@@ -0,0 +1,25 @@
+"""add (status, day) index to tasks
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16
+
+The north-star window counts done tasks per day over a date range
+(status = 'done' AND day BETWEEN ...). With status leading, that is a
+single range scan over done tasks only, instead of every task in the
+window via ix_tasks_day.
+"""
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tasks_status_day", "tasks", ["status", "day"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_status_day", table_name="tasks")
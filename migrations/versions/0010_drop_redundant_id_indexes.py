@@ -0,0 +1,38 @@
+"""drop ix_<table>_id indexes that duplicate the primary key
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16
+
+0001 created a plain index on every table's id next to the primary key's
+own unique index. Lookups by id already use the PK index, so the copies
+only added a B-tree update to every INSERT.
+"""
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+_ID_INDEXES = [
+    ("ix_entries_id", "entries"),
+    ("ix_facts_id", "facts"),
+    ("ix_metrics_daily_id", "metrics_daily"),
+    ("ix_transactions_id", "transactions"),
+    ("ix_projects_id", "projects"),
+    ("ix_tasks_id", "tasks"),
+    ("ix_rules_router_id", "rules_router"),
+    ("ix_memory_snapshots_id", "memory_snapshots"),
+    ("ix_daily_logs_id", "daily_logs"),
+]
+
+
+def upgrade() -> None:
+    for name, table in _ID_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table in reversed(_ID_INDEXES):
+        op.create_index(name, table, ["id"])
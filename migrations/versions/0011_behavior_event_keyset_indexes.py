@@ -0,0 +1,48 @@
+"""extend behavior_events list indexes with id DESC
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16
+
+GET /behavior/events orders and seeks on (created_at, id) DESC. The 0006
+indexes stop at created_at, so ties needed an incremental sort and the
+keyset anchor could not be seeked directly. Replaced by
+(event_type, created_at DESC, id DESC) and (created_at DESC, id DESC).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_behavior_event_created_at_desc", table_name="behavior_events")
+    op.drop_index("ix_behavior_event_type_created_at", table_name="behavior_events")
+    op.create_index(
+        "ix_behavior_event_type_created_at_id",
+        "behavior_events",
+        ["event_type", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_behavior_event_created_at_id_desc",
+        "behavior_events",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_behavior_event_created_at_id_desc", table_name="behavior_events")
+    op.drop_index("ix_behavior_event_type_created_at_id", table_name="behavior_events")
+    op.create_index(
+        "ix_behavior_event_type_created_at",
+        "behavior_events",
+        ["event_type", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_behavior_event_created_at_desc",
+        "behavior_events",
+        [sa.text("created_at DESC")],
+    )
@@ -2,20 +2,50 @@
 Shared pytest fixtures.
 
 Uses an in-memory SQLite database so no Postgres is required for tests.
+Each test runs inside a transaction on one shared connection that is rolled
+back afterwards; sessions join it through SAVEPOINTs, so their commit() and
+rollback() work as usual without leaking state into the next test.
 """
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from app.db.base import Base, get_db
+from app.db.base import Base, get_db, get_engine
 from app.main import app
 from app.models.rule import RuleRouter
 
-SQLITE_URL = "sqlite:///./test_dios.db"
+SQLITE_URL = "sqlite://"
+
+# An in-memory database lives and dies with its connection, so every session
+# (test fixtures and the app under test alike) shares one via StaticPool.
+engine = create_engine(
+    SQLITE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+# Bound to the per-run connection by the `connection` fixture.
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    join_transaction_mode="create_savepoint",
+)
+
+# /health opens its own connection; give it a separate database so that
+# checkout doesn't touch the shared connection's open transaction.
+_probe_engine = create_engine(SQLITE_URL)
+
+
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, _):
+    # pysqlite's own BEGIN handling breaks SAVEPOINT; let SQLAlchemy emit it.
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
-engine = create_engine(SQLITE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 _DEFAULT_RULES = [
     ("task_prefix",      r"^(TODO|TASK|tarea|hacer)",                     "tasks",          "task",        100),
@@ -40,23 +70,32 @@ def override_get_db():
 def create_tables():
     Base.metadata.create_all(bind=engine)
     # Seed default routing rules (normally done by Alembic migration)
-    db = TestingSessionLocal()
-    try:
-        if db.query(RuleRouter).count() == 0:
-            for name, pattern, target, entry_type, priority in _DEFAULT_RULES:
-                db.add(RuleRouter(
-                    name=name,
-                    pattern=pattern,
-                    target=target,
-                    entry_type=entry_type,
-                    priority=priority,
-                    is_active=True,
-                ))
-            db.commit()
-    finally:
-        db.close()
+    with engine.begin() as conn:
+        conn.execute(insert(RuleRouter), [
+            {
+                "name": name,
+                "pattern": pattern,
+                "target": target,
+                "entry_type": entry_type,
+                "priority": priority,
+                "is_active": True,
+            }
+            for name, pattern, target, entry_type, priority in _DEFAULT_RULES
+        ])
+
+
+@pytest.fixture(scope="session")
+def connection(create_tables):
+    with engine.connect() as conn:
+        TestingSessionLocal.configure(bind=conn)
+        yield conn
+
+
+@pytest.fixture(autouse=True)
+def _rollback_after_test(connection):
+    transaction = connection.begin()
     yield
-    Base.metadata.drop_all(bind=engine)
+    transaction.rollback()
 
 
 @pytest.fixture()
@@ -68,9 +107,11 @@ def db():
         db.close()
 
 
-@pytest.fixture()
-def client(db):
+@pytest.fixture(scope="session")
+def client(connection):
+    # One TestClient (and one lifespan startup/shutdown) for the whole run.
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_engine] = lambda: _probe_engine
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
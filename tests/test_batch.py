@@ -6,7 +6,8 @@ Covers:
 - Partial failure: one bad item doesn't cancel the others
 - Batch-level source/day defaults inherited by items
 - Item-level source/day overrides batch defaults
-- Validation: empty batch, too many items, invalid source
+- Validation: empty batch, too many items, invalid source, non-JSON content type
+- OpenAPI request body refs resolve
 - routed_entity returned per item
 - Counts in BatchIngestResponse
 """
@@ -68,6 +69,23 @@ class TestBatchHappyPath:
         assert items[1]["entry"]["routed_entity"]["type"] == "transaction"
         assert items[2]["entry"]["routed_entity"]["type"] == "metric"
 
+    def test_interleaved_types_map_back_to_their_items(self, client):
+        payload = {
+            "items": [
+                {"raw": "TODO: alfa"},
+                {"raw": "gasté $7 en pan"},
+                {"raw": "TODO: beta"},
+                {"raw": "gasté $9 en leche"},
+            ]
+        }
+        items = client.post(BASE_URL, json=payload).json()["items"]
+        assert items[0]["entry"]["routed_entity"]["title"] == "alfa"
+        assert items[1]["entry"]["routed_entity"]["amount"] == "7.00"
+        assert items[2]["entry"]["routed_entity"]["title"] == "beta"
+        assert items[3]["entry"]["routed_entity"]["amount"] == "9.00"
+        ids = [item["entry"]["id"] for item in items]
+        assert ids == sorted(ids)
+
     def test_single_item_batch(self, client):
         payload = {"items": [{"raw": "TODO: solo un item"}]}
         r = client.post(BASE_URL, json=payload)
@@ -191,6 +209,44 @@ class TestBatchValidation:
         r = client.post(BASE_URL, json=payload)
         assert r.status_code == 422
 
+    def test_malformed_json_rejected(self, client):
+        r = client.post(
+            BASE_URL, content=b'{"items": [', headers={"content-type": "application/json"}
+        )
+        assert r.status_code == 422
+        assert r.json()["details"]["errors"][0]["type"] == "json_invalid"
+
+    def test_non_json_content_type_rejected(self, client):
+        r = client.post(
+            BASE_URL, content=b'{"items": [{"raw": "algo"}]}', headers={"content-type": "text/plain"}
+        )
+        assert r.status_code == 422
+
+    def test_openapi_body_refs_resolve(self, client):
+        schema = client.get("/openapi.json").json()
+        components = schema["components"]["schemas"]
+        body = schema["paths"][BASE_URL]["post"]["requestBody"]["content"]["application/json"]
+        seen: set[str] = set()
+        pending = [body["schema"]]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, list):
+                pending.extend(node)
+            elif isinstance(node, dict):
+                ref = node.get("$ref")
+                if ref is not None and ref not in seen:
+                    seen.add(ref)
+                    name = ref.removeprefix("#/components/schemas/")
+                    assert name in components, ref
+                    pending.append(components[name])
+                pending.extend(node.values())
+        assert "#/components/schemas/BatchIngestRequest" in seen
+
+    def test_item_error_location_reported(self, client):
+        r = client.post(BASE_URL, json={"items": [{"raw": "ok"}, {"raw": "   "}]})
+        assert r.status_code == 422
+        assert r.json()["details"]["errors"][0]["field"] == "items.1.raw"
+
     def test_all_valid_sources_accepted(self, client):
         for src in ["voice", "text", "cli", "api", "slack", "webhook"]:
             r = client.post(BASE_URL, json={
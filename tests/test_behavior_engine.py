@@ -10,7 +10,8 @@ Covered scenarios (spec):
 Additional:
   - Metadata correctness
   - Task "Reset Day Protocol" created and persisted
-  - GET /behavior/events list + filter
+  - GET /behavior/events list + filter + cursor pagination
+  - GET /behavior/events/count
   - No cross-contamination between rules
   - score == 0.4 (boundary) does NOT trigger warning
   - score < 1.0 does NOT trigger perfect_week
@@ -20,6 +21,7 @@ with other test suites sharing the same in-memory SQLite session.
 """
 from __future__ import annotations
 
+import base64
 import pytest
 from datetime import date, timedelta
 from decimal import Decimal
@@ -191,20 +193,23 @@ class TestEvaluateAndReactUnit:
 class TestScenarioWarning:
     """score < 0.4 → clarity_warning event emitted."""
 
-    def test_warning_emitted_for_low_score(self, client):
+    @pytest.fixture()
+    def triggered(self, client):
         # No seeding → all 7 days empty → score 0.0
         _trigger_north_star(client, _WARN_END)
+
+    def test_warning_emitted_for_low_score(self, client, triggered):
         events = _behavior_events(client, EventType.CLARITY_WARNING)
         matching = [e for e in events if e["reference_date"] == _WARN_END]
         assert len(matching) == 1
 
-    def test_warning_metadata_contains_score(self, client):
+    def test_warning_metadata_contains_score(self, client, triggered):
         events = _behavior_events(client, EventType.CLARITY_WARNING)
         ev = next(e for e in events if e["reference_date"] == _WARN_END)
         assert "score" in ev["metadata"]
         assert float(ev["metadata"]["score"]) < 0.4
 
-    def test_warning_metadata_contains_complete_days(self, client):
+    def test_warning_metadata_contains_complete_days(self, client, triggered):
         events = _behavior_events(client, EventType.CLARITY_WARNING)
         ev = next(e for e in events if e["reference_date"] == _WARN_END)
         assert "complete_days" in ev["metadata"]
@@ -223,29 +228,32 @@ class TestScenarioWarning:
 class TestScenarioResetDayProtocol:
     """3 consecutive incomplete days → reset_day_protocol event + Task."""
 
-    def test_reset_event_emitted(self, client):
+    @pytest.fixture()
+    def triggered(self, client):
         # Only make the first 4 days complete; last 3 are empty → triggers reset
         days = _week_days(_RESET_END)
         for d in days[:4]:
             _make_complete_day(client, d)
         _trigger_north_star(client, _RESET_END)
+
+    def test_reset_event_emitted(self, client, triggered):
         events = _behavior_events(client, EventType.RESET_DAY_PROTOCOL)
         matching = [e for e in events if e["reference_date"] == _RESET_END]
         assert len(matching) == 1
 
-    def test_reset_metadata_contains_incomplete_days(self, client):
+    def test_reset_metadata_contains_incomplete_days(self, client, triggered):
         events = _behavior_events(client, EventType.RESET_DAY_PROTOCOL)
         ev = next(e for e in events if e["reference_date"] == _RESET_END)
         assert "incomplete_days" in ev["metadata"]
         assert len(ev["metadata"]["incomplete_days"]) == _CONSECUTIVE_INCOMPLETE
 
-    def test_reset_metadata_contains_task_id(self, client):
+    def test_reset_metadata_contains_task_id(self, client, triggered):
         events = _behavior_events(client, EventType.RESET_DAY_PROTOCOL)
         ev = next(e for e in events if e["reference_date"] == _RESET_END)
         assert "task_id" in ev["metadata"]
         assert isinstance(ev["metadata"]["task_id"], int)
 
-    def test_reset_task_appears_in_active_state(self, client):
+    def test_reset_task_appears_in_active_state(self, client, triggered):
         r = client.get("/state/active")
         open_tasks = r.json()["open_tasks"]
         assert any("Reset Day Protocol" in t["title"] for t in open_tasks)
@@ -263,15 +271,18 @@ class TestScenarioResetDayProtocol:
 class TestScenarioPerfectWeek:
     """score == 1.0 → perfect_week event."""
 
-    def test_perfect_week_event_emitted(self, client):
+    @pytest.fixture()
+    def triggered(self, client):
         for d in _week_days(_PERFECT_END):
             _make_complete_day(client, d)
         _trigger_north_star(client, _PERFECT_END)
+
+    def test_perfect_week_event_emitted(self, client, triggered):
         events = _behavior_events(client, EventType.PERFECT_WEEK)
         matching = [e for e in events if e["reference_date"] == _PERFECT_END]
         assert len(matching) == 1
 
-    def test_perfect_week_metadata_score_is_1(self, client):
+    def test_perfect_week_metadata_score_is_1(self, client, triggered):
         events = _behavior_events(client, EventType.PERFECT_WEEK)
         ev = next(e for e in events if e["reference_date"] == _PERFECT_END)
         assert float(ev["metadata"]["score"]) == 1.0
@@ -326,10 +337,11 @@ class TestBehaviorEventsEndpoint:
         r = client.get("/behavior/events")
         assert r.status_code == 200
 
-    def test_response_has_total_and_items(self, client):
+    def test_response_has_cursor_and_items(self, client):
         r = client.get("/behavior/events")
         body = r.json()
-        assert "total" in body
+        assert "next_cursor" in body
+        assert "total" not in body
         assert "items" in body
         assert isinstance(body["items"], list)
 
@@ -347,6 +359,13 @@ class TestBehaviorEventsEndpoint:
         for field in ["id", "event_type", "reference_date", "created_at"]:
             assert field in items[0]
 
+    def test_empty_metadata_returned_as_empty_object(self, client, db):
+        db.add(BehaviorEvent(event_type="metadata_probe",
+                             reference_date=date(2092, 12, 31), event_metadata={}))
+        db.commit()
+        items = _behavior_events(client, "metadata_probe")
+        assert items[0]["metadata"] == {}
+
     def test_pagination_limit(self, client):
         r = client.get("/behavior/events?limit=1")
         assert len(r.json()["items"]) <= 1
@@ -354,3 +373,52 @@ class TestBehaviorEventsEndpoint:
     def test_invalid_limit_rejected(self, client):
         r = client.get("/behavior/events?limit=0")
         assert r.status_code == 422
+
+    def test_cursor_walks_all_events_once(self, client):
+        _trigger_north_star(client, _WARN_END)
+        _trigger_north_star(client, _PERFECT_END)
+        expected = [e["id"] for e in client.get("/behavior/events?limit=200").json()["items"]]
+        assert len(expected) >= 2
+
+        seen: list[int] = []
+        url = "/behavior/events?limit=1"
+        while True:
+            body = client.get(url).json()
+            seen.extend(e["id"] for e in body["items"])
+            if body["next_cursor"] is None:
+                break
+            url = f"/behavior/events?limit=1&cursor={body['next_cursor']}"
+        assert seen == expected
+
+    def test_last_page_has_no_cursor(self, client):
+        r = client.get("/behavior/events?limit=200")
+        assert r.json()["next_cursor"] is None
+
+    def test_invalid_cursor_rejected(self, client):
+        r = client.get("/behavior/events?cursor=not-a-cursor")
+        assert r.status_code == 400
+        assert r.json()["code"] == "INVALID_CURSOR"
+
+    def test_out_of_range_cursor_rejected(self, client):
+        cursor = base64.urlsafe_b64encode(b"99999999999999999999").decode()
+        r = client.get(f"/behavior/events?cursor={cursor}")
+        assert r.status_code == 400
+        assert r.json()["code"] == "INVALID_CURSOR"
+
+    def test_cursor_for_missing_event_rejected(self, client):
+        cursor = base64.urlsafe_b64encode(b"987654321").decode().rstrip("=")
+        r = client.get(f"/behavior/events?cursor={cursor}")
+        assert r.status_code == 400
+        assert r.json()["code"] == "INVALID_CURSOR"
+
+    def test_count_matches_listing(self, client):
+        _trigger_north_star(client, _WARN_END)
+        total = client.get("/behavior/events/count").json()["total"]
+        items = client.get("/behavior/events?limit=200").json()["items"]
+        assert total == len(items)
+
+    def test_count_filter_by_event_type(self, client):
+        _trigger_north_star(client, _WARN_END)
+        et = EventType.CLARITY_WARNING
+        total = client.get(f"/behavior/events/count?event_type={et}").json()["total"]
+        assert total == len(_behavior_events(client, et))
@@ -0,0 +1,24 @@
+"""
+Unit tests for application settings.
+"""
+from app.core.config import Settings
+
+
+class TestCorsOriginsList:
+    def test_wildcard(self):
+        assert Settings(CORS_ORIGINS=" * ").cors_origins_list == ["*"]
+
+    def test_comma_separated_list_is_stripped(self):
+        s = Settings(CORS_ORIGINS="https://a.com, https://b.com ,")
+        assert s.cors_origins_list == ["https://a.com", "https://b.com"]
+
+    def test_parsed_once_per_instance(self):
+        s = Settings(CORS_ORIGINS="https://a.com")
+        assert s.cors_origins_list is s.cors_origins_list
+
+
+class TestGetSettings:
+    def test_singleton(self):
+        from app.core.config import get_settings, settings
+        assert get_settings() is get_settings()
+        assert get_settings() is settings
@@ -0,0 +1,110 @@
+"""
+Tests for the pure-ASGI CORS middleware.
+
+Covers:
+- Preflight short-circuit (204, allow-* headers, never reaches the app)
+- Simple cross-origin request gets allow-origin appended
+- Same-origin request (no Origin header) is untouched
+- Disallowed origin on a restricted list
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.cors import FastCORSMiddleware
+
+_ORIGIN = "https://dios.example.com"
+
+
+def _make_client(**kwargs) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(FastCORSMiddleware, **kwargs)
+
+    @app.get("/ping")
+    def ping():
+        return {"pong": True}
+
+    return TestClient(app)
+
+
+def _preflight(client: TestClient, origin: str = _ORIGIN, headers: str = "content-type"):
+    return client.options(
+        "/ping",
+        headers={
+            "Origin": origin,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": headers,
+        },
+    )
+
+
+class TestPreflight:
+    def test_preflight_returns_204(self):
+        client = _make_client(allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+        r = _preflight(client)
+        assert r.status_code == 204
+        assert r.content == b""
+
+    def test_preflight_echoes_requested_headers_when_wildcard(self):
+        client = _make_client(allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+        r = _preflight(client, headers="content-type,x-custom")
+        assert r.headers["access-control-allow-headers"] == "content-type,x-custom"
+        assert "POST" in r.headers["access-control-allow-methods"]
+
+    def test_preflight_sends_max_age(self):
+        client = _make_client(allow_origins=["*"], allow_methods=["*"], max_age=123)
+        r = _preflight(client)
+        assert r.headers["access-control-max-age"] == "123"
+
+    def test_preflight_disallowed_origin(self):
+        client = _make_client(allow_origins=[_ORIGIN], allow_methods=["*"])
+        r = _preflight(client, origin="https://evil.example.com")
+        assert r.status_code == 400
+        assert "access-control-allow-origin" not in r.headers
+
+
+class TestSimpleRequests:
+    def test_wildcard_origin_without_credentials(self):
+        client = _make_client(allow_origins=["*"], allow_methods=["*"])
+        r = client.get("/ping", headers={"Origin": _ORIGIN})
+        assert r.status_code == 200
+        assert r.headers["access-control-allow-origin"] == "*"
+        assert "vary" not in r.headers
+
+    def test_credentials_echo_origin(self):
+        client = _make_client(allow_origins=["*"], allow_methods=["*"], allow_credentials=True)
+        r = client.get("/ping", headers={"Origin": _ORIGIN})
+        assert r.headers["access-control-allow-origin"] == _ORIGIN
+        assert r.headers["access-control-allow-credentials"] == "true"
+        assert r.headers["vary"] == "Origin"
+
+    def test_no_origin_header_untouched(self):
+        client = _make_client(allow_origins=["*"], allow_methods=["*"])
+        r = client.get("/ping")
+        assert r.status_code == 200
+        assert "access-control-allow-origin" not in r.headers
+
+    def test_disallowed_origin_gets_no_cors_headers(self):
+        client = _make_client(allow_origins=[_ORIGIN], allow_methods=["*"])
+        r = client.get("/ping", headers={"Origin": "https://evil.example.com"})
+        assert r.status_code == 200
+        assert "access-control-allow-origin" not in r.headers
+
+    def test_app_cors_on_health(self, client):
+        r = client.get("/health", headers={"Origin": _ORIGIN})
+        assert r.status_code == 200
+        assert "access-control-allow-origin" in r.headers
+
+    def test_app_preflight_max_age_from_settings(self, client):
+        from app.core.config import settings
+        r = _preflight(client)
+        assert r.status_code == 204
+        assert r.headers["access-control-max-age"] == str(settings.CORS_MAX_AGE)
+
+    def test_app_wildcard_origins_send_static_header(self, client):
+        from app.core.config import settings
+        if settings.cors_origins_list != ["*"]:
+            pytest.skip("CORS_ORIGINS is not \"*\" in this environment")
+        r = client.get("/health", headers={"Origin": _ORIGIN})
+        assert r.headers["access-control-allow-origin"] == "*"
+        assert "access-control-allow-credentials" not in r.headers
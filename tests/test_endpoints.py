@@ -34,6 +34,11 @@ class TestIngest:
         body = r.json()
         assert body["routed_to"] == "transactions"
 
+    def test_ingest_expense_unrepresentable_amount(self, client):
+        r = client.post("/ingest", json={"raw": "gasté $99999999999999999999999999999 en algo"})
+        assert r.status_code == 201
+        assert r.json()["routed_entity"]["amount"] == "0.00"
+
     def test_ingest_fact(self, client):
         r = client.post("/ingest", json={"raw": "FACT: el agua hierve a 100C"})
         assert r.status_code == 201
@@ -153,6 +158,14 @@ class TestStateActive:
         open_tasks = r.json()["open_tasks"]
         assert any("active task for test" in t["title"] for t in open_tasks)
 
+    def test_closed_day_not_listed_as_open(self, client):
+        client.post("/ingest", json={"raw": "open day entry", "day": "2093-05-02"})
+        client.post("/ingest", json={"raw": "closed day entry", "day": "2093-05-01"})
+        client.post("/state/close-day", json={"day": "2093-05-01"})
+        days = [d["day"] for d in client.get("/state/active").json()["open_days"]]
+        assert "2093-05-02" in days
+        assert "2093-05-01" not in days
+
 
 class TestCloseDay:
     def test_close_day_today(self, client):
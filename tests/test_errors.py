@@ -8,6 +8,7 @@ from app.core.errors import (
     BatchTooLargeError,
     EmptyBatchError,
     EntryIngestionError,
+    InvalidCursorError,
     RouterNoActiveRulesError,
 )
 from datetime import date
@@ -61,6 +62,23 @@ class TestExceptionClasses:
         # details should not be in dict when empty
         assert "details" not in d
 
+    def test_cached_bytes_match_to_dict(self):
+        import orjson
+        for err in (EmptyBatchError(), RouterNoActiveRulesError(), InvalidCursorError()):
+            assert orjson.loads(err.cached_bytes()) == err.to_dict()
+
+    def test_detail_less_errors_share_cached_bytes(self):
+        assert EmptyBatchError().cached_bytes() is EmptyBatchError().cached_bytes()
+
+    def test_dynamic_errors_have_no_cached_bytes(self):
+        for err in (
+            BatchTooLargeError(max_items=100, received=150),
+            DayAlreadyClosedError(day=date(2026, 2, 20)),
+            EntryIngestionError(message="oops"),
+            EntryIngestionError(message="oops", raw="x"),
+        ):
+            assert err.cached_bytes() is None
+
 
 # ---------------------------------------------------------------------------
 # Integration tests on HTTP error responses
@@ -145,3 +163,11 @@ class TestSourceChannelValidation:
         r = client.post("/ingest", json={"raw": "test", "source": source})
         assert r.status_code == 422
         assert r.json()["code"] == "VALIDATION_ERROR"
+
+
+class TestValidationFieldPaths:
+    def test_batch_item_field_path_keeps_index(self, client):
+        r = client.post("/ingest/batch", json={"items": [{"raw": "ok"}, {"raw": ""}]})
+        assert r.status_code == 422
+        fields = [e["field"] for e in r.json()["details"]["errors"]]
+        assert "items.1.raw" in fields
@@ -24,6 +24,9 @@ class TestExtractAmount:
     def test_commas(self):
         assert _extract_amount("$1,500 salary") == Decimal("1500")
 
+    def test_too_many_digits(self):
+        assert _extract_amount("gasté $99999999999999999999999999999") is None
+
 
 class TestDetectTxType:
     def test_income_ingreso(self):
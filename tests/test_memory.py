@@ -21,8 +21,9 @@ from app.services.memory import (
     _extract_key_events,
     _extract_decisions,
     _extract_lessons,
-    _jdump,
-    _jload,
+    _as_list,
+    _dedup_cap,
+    split_tags,
 )
 from app.models.task import TaskStatus
 from app.models.transaction import TransactionType
@@ -71,19 +72,47 @@ class TestEmotionalState:
         assert state == "neutral"
 
 
-class TestJsonHelpers:
-    def test_jdump_jload_roundtrip(self):
+class TestListColumnHelper:
+    def test_list_passthrough(self):
         items = ["one", "dos", "três"]
-        assert _jload(_jdump(items)) == items
+        assert _as_list(items) == items
 
-    def test_jload_empty_string(self):
-        assert _jload("") == []
+    def test_empty_string(self):
+        assert _as_list("") == []
 
-    def test_jload_none(self):
-        assert _jload(None) == []
+    def test_none(self):
+        assert _as_list(None) == []
 
-    def test_jload_invalid_json(self):
-        assert _jload("not-json") == []
+    def test_non_list_value(self):
+        assert _as_list("not-json") == []
+
+
+class TestSplitTags:
+    def test_strips_and_drops_empty(self):
+        assert split_tags(" task, fact ,,\tincome\n") == ["task", "fact", "income"]
+
+    def test_duplicates_dropped_keeping_first_order(self):
+        assert split_tags("task,fact, task,income,fact") == ["task", "fact", "income"]
+
+    def test_none_and_empty(self):
+        assert split_tags(None) == []
+        assert split_tags("") == []
+
+
+class TestDedupCap:
+    def test_keeps_first_occurrence_order(self):
+        assert _dedup_cap(["a", "b", "a", "c", "b"], 10) == ["a", "b", "c"]
+
+    def test_stops_at_cap_without_consuming_rest(self):
+        consumed = []
+
+        def items():
+            for x in ["a", "a", "b", "c", "d"]:
+                consumed.append(x)
+                yield x
+
+        assert _dedup_cap(items(), 2) == ["a", "b"]
+        assert consumed == ["a", "a", "b"]
 
 
 class TestExtractDecisions:
@@ -219,6 +248,15 @@ class TestCompileDay:
         # Same ID → same row was updated
         assert r1.json()["id"] == r2.json()["id"]
 
+    def test_recompile_day_updates_fields(self, client):
+        day = "2026-02-03"
+        r1 = client.post("/memory/compile-day", json={"day": day})
+        client.post("/ingest", json={"raw": "TODO: tarea posterior", "day": day})
+        r2 = client.post("/memory/compile-day", json={"day": day})
+        assert r2.json()["id"] == r1.json()["id"]
+        assert r1.json()["summary"] != r2.json()["summary"]
+        assert "task" in r2.json()["tags"]
+
     def test_response_has_all_required_fields(self, client):
         r = client.post("/memory/compile-day", json={"day": "2026-02-01"})
         body = r.json()
@@ -324,6 +362,20 @@ class TestSnapshotsList:
         if len(all_ids) > 1:
             assert off_ids == all_ids[1:]
 
+    def test_total_counts_all_matches_not_page(self, client):
+        client.post("/memory/compile-day", json={"day": "2026-06-02"})
+        client.post("/memory/compile-day", json={"day": "2026-06-03"})
+        full = client.get("/memory/snapshots?limit=100").json()
+        page = client.get("/memory/snapshots?limit=1").json()
+        assert len(page["items"]) == 1
+        assert page["total"] == full["total"] == len(full["items"])
+
+    def test_total_kept_past_last_page(self, client):
+        total = client.get("/memory/snapshots?limit=100").json()["total"]
+        body = client.get(f"/memory/snapshots?limit=10&offset={total + 5}").json()
+        assert body["items"] == []
+        assert body["total"] == total
+
     def test_sorted_newest_first(self, client):
         client.post("/memory/compile-day", json={"day": "2026-06-20"})
         client.post("/memory/compile-day", json={"day": "2026-06-21"})
@@ -125,10 +125,12 @@ _SINGLE_DAY_TEST    = "2091-05-15"
 class TestScenarioAllComplete:
     """7 complete days → score == 1.0"""
 
-    def test_all_7_complete_days(self, client):
+    @pytest.fixture()
+    def seeded(self, client):
         for day in _week_of(_ALL_COMPLETE_END):
             _make_complete_day(client, day)
 
+    def test_all_7_complete_days(self, client, seeded):
         r = client.get(f"/metrics/north-star?reference_date={_ALL_COMPLETE_END}")
         assert r.status_code == 200
         body = r.json()
@@ -136,7 +138,7 @@ class TestScenarioAllComplete:
         assert body["complete_days"] == 7
         assert body["total_days"] == 7
 
-    def test_all_days_marked_complete_in_breakdown(self, client):
+    def test_all_days_marked_complete_in_breakdown(self, client, seeded):
         r = client.get(f"/metrics/north-star?reference_date={_ALL_COMPLETE_END}")
         for day_item in r.json()["days"]:
             assert day_item["is_complete"] is True
@@ -170,10 +172,12 @@ class TestScenarioMixed:
     # Make exactly 3 of the 7 days complete
     _COMPLETE_DAYS = [_week_of(_MIXED_END)[i] for i in (0, 2, 5)]  # Mon, Wed, Sat
 
-    def test_mixed_score_is_correct(self, client):
+    @pytest.fixture()
+    def seeded(self, client):
         for day in self._COMPLETE_DAYS:
             _make_complete_day(client, day)
 
+    def test_mixed_score_is_correct(self, client, seeded):
         r = client.get(f"/metrics/north-star?reference_date={_MIXED_END}")
         assert r.status_code == 200
         body = r.json()
@@ -182,7 +186,7 @@ class TestScenarioMixed:
         # 3/7 ≈ 0.4286
         assert abs(body["weekly_clarity_score"] - 3 / 7) < 0.001
 
-    def test_mixed_breakdown_correct_flags(self, client):
+    def test_mixed_breakdown_correct_flags(self, client, seeded):
         r = client.get(f"/metrics/north-star?reference_date={_MIXED_END}")
         days = r.json()["days"]
         complete_dates = {str(d) for d in self._COMPLETE_DAYS}
@@ -4,7 +4,11 @@ Uses pre-built RuleRouter objects without a DB.
 """
 import pytest
 from app.models.rule import RuleRouter
-from app.services.router import route_entry_from_rules
+from app.services.router import (
+    invalidate_rules_cache,
+    load_active_rules,
+    route_entry_from_rules,
+)
 
 
 def make_rule(name, pattern, target, entry_type, priority, is_active=True):
@@ -103,3 +107,40 @@ class TestRouterRules:
         assert result.entry_type == "note"
         assert result.target == "facts"
         assert result.rule_name is None
+
+
+class TestActiveRulesCache:
+    def test_second_load_reuses_cached_list(self, db):
+        invalidate_rules_cache()
+        first = load_active_rules(db)
+        assert first, "conftest seeds the default rules"
+        assert load_active_rules(db) is first
+
+    def test_invalidate_after_commit_picks_up_write(self, db):
+        before = load_active_rules(db)
+        rule = RuleRouter(name="cache_probe", pattern=r"^PROBE", target="facts",
+                          entry_type="fact", priority=500, is_active=True)
+        db.add(rule)
+        db.commit()
+        try:
+            assert load_active_rules(db) is before
+            invalidate_rules_cache()
+            after = load_active_rules(db)
+            assert after[0].name == "cache_probe"
+        finally:
+            db.delete(rule)
+            db.commit()
+            invalidate_rules_cache()
+        assert all(r.name != "cache_probe" for r in load_active_rules(db))
+
+    def test_invalidate_after_rollback_drops_uncommitted_rule(self, db):
+        db.add(RuleRouter(name="rollback_probe", pattern=r"^PROBE", target="facts",
+                          entry_type="fact", priority=500, is_active=True))
+        db.flush()
+        invalidate_rules_cache()
+        # The writing session sees (and caches) its own uncommitted rule...
+        assert load_active_rules(db)[0].name == "rollback_probe"
+        db.rollback()
+        invalidate_rules_cache()
+        # ...and invalidating after the rollback stops it being served.
+        assert all(r.name != "rollback_probe" for r in load_active_rules(db))